@@ -6,6 +6,7 @@ Routes commands to the appropriate subcommand handlers.
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
 
 from .config import VERSION
@@ -31,8 +32,12 @@ def main(argv: list[str] | None = None) -> int:
         return e.exit_code
 
 
-def _main(argv: list[str] | None = None) -> int:
-    """Internal main function that may raise exceptions."""
+@functools.lru_cache(maxsize=1)
+def _create_parser() -> argparse.ArgumentParser:
+    """Create the command router parser.
+
+    Built once per process; parsing and printing help do not mutate it.
+    """
     parser = argparse.ArgumentParser(
         prog="distrobox",
         description="Create and manage containerized environments",
@@ -57,6 +62,13 @@ def _main(argv: list[str] | None = None) -> int:
     subparsers.add_parser("stop", help="Stop running containers")
     subparsers.add_parser("upgrade", help="Upgrade containers")
 
+    return parser
+
+
+def _main(argv: list[str] | None = None) -> int:
+    """Internal main function that may raise exceptions."""
+    parser = _create_parser()
+
     if argv is None:
         argv = sys.argv[1:]
 
@@ -64,6 +64,10 @@ caching - the same configuration will reuse an existing build.
         action="store_true",
         help="force rebuild even if image already exists",
     )
+    parser.add_argument(
+        "--cache-from",
+        help="image to use as a layer cache source for the build",
+    )
     parser.add_argument(
         "-d",
         "--dry-run",
@@ -154,14 +158,7 @@ def run(args: list[str] | None = None) -> int:
         print(f"# Would be tagged as: {tag}")
         return 0
 
-    # Check if base image exists, pull if not
-    if not manager.image_exists(image):
-        print_error(f"Pulling base image: {image}")
-        if not manager.pull(image):
-            print_error(red(f"Failed to pull image: {image}"))
-            return 1
-
-    # Build the image
+    # Build the image, pulling the base image only if a build is needed
     result = ensure_boost_image(
         manager,
         image,
@@ -170,6 +167,8 @@ def run(args: list[str] | None = None) -> int:
         pre_init_hooks,
         verbose=config.verbose,
         force=parsed.force,
+        cache_from=parsed.cache_from,
+        pull_base=True,
     )
 
     if result:
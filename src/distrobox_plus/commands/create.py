@@ -14,8 +14,6 @@ from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING
-from urllib.error import URLError
-from urllib.request import urlopen
 
 from ..config import (
     DEFAULT_IMAGE,
@@ -113,6 +111,10 @@ def show_compatibility() -> int:
     Returns:
         Exit code (0 on success, 1 on failure)
     """
+    # urllib.request pulls in http.client, ssl and email; only needed here
+    from urllib.error import URLError
+    from urllib.request import urlopen
+
     cache_dir = get_cache_dir()
     cache_file = cache_dir / f"distrobox-compatibility-{VERSION}"
 
@@ -505,13 +507,16 @@ def _add_rootfs_mounts(cmd: list[str], manager: ContainerManager) -> None:
     if manager.is_podman and manager.uses_runc():
         # Mount directories one by one for podman+runc compatibility
         ro_mounts = find_ro_mountpoints()
-        for rootdir in Path("/").iterdir():
-            if is_symlink(str(rootdir)):
-                continue
-            if str(rootdir) in ro_mounts:
-                cmd.append(f"--volume={rootdir}:/run/host{rootdir}:ro,rslave")
-            else:
-                cmd.append(f"--volume={rootdir}:/run/host{rootdir}:rslave")
+        # scandir reports each entry's type without an lstat per directory
+        with os.scandir("/") as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                rootdir = entry.path
+                if rootdir in ro_mounts:
+                    cmd.append(f"--volume={rootdir}:/run/host{rootdir}:ro,rslave")
+                else:
+                    cmd.append(f"--volume={rootdir}:/run/host{rootdir}:rslave")
     else:
         cmd.append("--volume=/:/run/host/:rslave")
 
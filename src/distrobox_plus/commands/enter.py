@@ -293,6 +293,23 @@ def wait_for_container_setup(
             logs_proc.wait()
 
 
+def _split_args(args: list[str]) -> tuple[list[str], list[str]]:
+    """Split args at -- (or, failing that, -e) in a single pass.
+
+    Returns:
+        Tuple of (distrobox_args, container_command)
+    """
+    exec_idx = -1
+    for i, arg in enumerate(args):
+        if arg == "--":
+            return args[:i], args[i + 1 :]
+        if arg == "-e" and exec_idx < 0:
+            exec_idx = i
+    if exec_idx >= 0:
+        return args[:exec_idx], args[exec_idx + 1 :]
+    return args, []
+
+
 def run(args: list[str] | None = None) -> int:
     """Run the distrobox-enter command.
 
@@ -312,17 +329,7 @@ def run(args: list[str] | None = None) -> int:
         args = sys.argv[1:]
 
     # Split args at -- to separate distrobox args from container command
-    container_command: list[str] = []
-    distrobox_args = args
-
-    if "--" in args:
-        idx = args.index("--")
-        distrobox_args = args[:idx]
-        container_command = args[idx + 1 :]
-    elif "-e" in args:
-        idx = args.index("-e")
-        distrobox_args = args[:idx]
-        container_command = args[idx + 1 :]
+    distrobox_args, container_command = _split_args(args)
 
     # Parse arguments
     parser = create_parser()
@@ -21,7 +21,7 @@ if TYPE_CHECKING:
     from types import FrameType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EphemeralOptions:
     """Options for ephemeral container."""
 
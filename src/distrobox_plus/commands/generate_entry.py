@@ -6,6 +6,7 @@ Generates a desktop entry for a distrobox container.
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import shutil
 import subprocess
@@ -65,6 +66,18 @@ def _get_icons_dir() -> Path:
     return _get_xdg_data_home() / "icons" / "distrobox"
 
 
+# Directories created during the current invocation; --all revisits the
+# same ones. Cleared by run() so a later invocation re-checks them.
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory and its parents once per invocation."""
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser for distrobox-generate-entry."""
     parser = argparse.ArgumentParser(
@@ -135,17 +148,24 @@ def _print_sudo_error() -> int:
     return 1
 
 
+@functools.lru_cache(maxsize=1)
+def _download_command(path: str | None) -> tuple[str, ...] | None:
+    """Look up curl or wget; cached per value of PATH."""
+    if shutil.which("curl", path=path):
+        return ("curl", "--connect-timeout", "3", "--retry", "1", "-sLo")
+    if shutil.which("wget", path=path):
+        return ("wget", "--timeout=3", "--tries=1", "-qO")
+    return None
+
+
 def _get_download_command() -> list[str] | None:
     """Get download command (curl or wget).
 
     Returns:
         Command list for downloading, or None if neither available.
     """
-    if shutil.which("curl"):
-        return ["curl", "--connect-timeout", "3", "--retry", "1", "-sLo"]
-    if shutil.which("wget"):
-        return ["wget", "--timeout=3", "--tries=1", "-qO"]
-    return None
+    cmd = _download_command(os.environ.get("PATH"))
+    return None if cmd is None else list(cmd)
 
 
 def _download_file(url: str, output_path: Path, download_cmd: list[str]) -> bool:
@@ -297,7 +317,7 @@ def _resolve_icon(
 
     # Ensure icons directory exists
     icons_dir = _get_icons_dir()
-    icons_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(icons_dir)
 
     # Get icon extension
     icon_extension = icon_url.rsplit(".", 1)[-1] if "." in icon_url else "png"
@@ -435,8 +455,8 @@ def _generate_entry(
         return 1
 
     # Ensure directories exist
-    _get_applications_dir().mkdir(parents=True, exist_ok=True)
-    _get_icons_dir().mkdir(parents=True, exist_ok=True)
+    _ensure_dir(_get_applications_dir())
+    _ensure_dir(_get_icons_dir())
 
     # Build extra flags
     extra_flags = ""
@@ -477,6 +497,9 @@ def run(args: list[str] | None = None) -> int:
     parser = create_parser()
     parsed = parser.parse_args(args)
 
+    # Directories may have been removed since an earlier in-process run
+    _created_dirs.clear()
+
     # Load config
     config = Config.load()
 
@@ -6,9 +6,11 @@ Removes one or more distrobox containers and cleans up exports.
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import shutil
 import sys
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -97,27 +99,63 @@ def cleanup_exported_binaries(container_name: str) -> None:
         container_name: Name of the container
     """
     bin_dir = Path.home() / ".local" / "bin"
-    if not bin_dir.exists():
+
+    # Opening the directory doubles as the existence check
+    try:
+        entries = os.scandir(bin_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return
 
     print_msg("Removing exported binaries...")
 
-    for binary in bin_dir.iterdir():
-        if not binary.is_file():
-            continue
+    # scandir reports each entry's type without an extra stat call
+    with entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+
+            try:
+                with open(entry.path) as f:
+                    content = f.read()
+                # Check if this binary was exported by distrobox for this container
+                if (
+                    "# distrobox_binary" in content
+                    and f"# name: {container_name}" in content
+                ):
+                    print_msg(f"Removing exported binary {entry.path}...")
+                    os.unlink(entry.path)
+            except (OSError, UnicodeDecodeError):
+                continue
+
+
+def _remove_icons(icons_dir: Path, icon_basenames: set[str]) -> None:
+    """Remove icon files named after any of the given basenames.
 
+    Walks the icon tree once, breadth first, for all removed apps.
+
+    Args:
+        icons_dir: Root of the icon tree
+        icon_basenames: Icon names without extension
+    """
+    prefixes = tuple(f"{name}." for name in icon_basenames)
+    pending = deque([str(icons_dir)])
+
+    while pending:
         try:
-            content = binary.read_text()
-            # Check if this binary was exported by distrobox for this container
-            if (
-                "# distrobox_binary" in content
-                and f"# name: {container_name}" in content
-            ):
-                print_msg(f"Removing exported binary {binary}...")
-                binary.unlink()
-        except (OSError, UnicodeDecodeError):
+            entries = os.scandir(pending.popleft())
+        except OSError:
             continue
 
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.startswith(prefixes):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        continue
+
 
 def cleanup_exported_apps(container_name: str) -> None:
     """Remove exported desktop applications for a container.
@@ -135,6 +173,7 @@ def cleanup_exported_apps(container_name: str) -> None:
     # Pattern: ${HOME}/.local/share/applications/${container_name}*
     pattern = f"{container_name}*"
     exec_pattern = re.compile(rf"Exec=.*{re.escape(container_name)} ")
+    icon_basenames: set[str] = set()
 
     for desktop_file in apps_dir.glob(pattern):
         if not desktop_file.is_file() and not desktop_file.is_symlink():
@@ -161,17 +200,19 @@ def cleanup_exported_apps(container_name: str) -> None:
 
             desktop_file.unlink()
 
-            # Remove associated icons
-            if icon_name and icons_dir.exists():
+            # Collect associated icons, removed below in a single walk
+            if icon_name:
                 # Get basename of icon in case it's a full path
                 icon_basename = Path(icon_name).stem
                 if icon_basename:
-                    for icon_file in icons_dir.rglob(f"{icon_basename}.*"):
-                        icon_file.unlink()
+                    icon_basenames.add(icon_basename)
 
         except (OSError, UnicodeDecodeError):
             continue
 
+    if icon_basenames:
+        _remove_icons(icons_dir, icon_basenames)
+
 
 def run_generate_entry_delete(container_name: str, verbose: bool = False) -> None:
     """Run distrobox-generate-entry --delete for a container.
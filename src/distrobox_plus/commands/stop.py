@@ -160,6 +160,11 @@ def run(args: list[str] | None = None) -> int:
             print_error("Exiting.")
             return 1
 
+    # A single named stop is the last thing this command does, so hand the
+    # process over to the container manager instead of waiting on a child
+    if len(container_names) == 1 and not parsed.all:
+        manager.exec_replace("stop", container_names[0])
+
     # Stop containers
     exit_code = 0
     for name in container_names:
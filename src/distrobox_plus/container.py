@@ -137,6 +137,11 @@ class ContainerManager:
             *args: Command arguments to pass to the container manager
         """
         import os
+        import sys
+
+        # Buffered output would be lost with the replaced process image
+        sys.stdout.flush()
+        sys.stderr.flush()
 
         cmd = [*self._cmd_prefix, *args]
         os.execvp(cmd[0], cmd)
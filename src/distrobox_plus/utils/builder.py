@@ -9,7 +9,7 @@ from __future__ import annotations
 import hashlib
 from typing import TYPE_CHECKING
 
-from .console import print_error, print_msg
+from .console import print_error, print_msg, red
 from .templates import (
     generate_additional_packages_cmd,
     generate_hooks_cmd,
@@ -122,6 +122,7 @@ def build_image(
     tag: str,
     containerfile_content: str,
     verbose: bool = False,
+    cache_from: str | None = None,
 ) -> bool:
     """Build a container image from Containerfile content.
 
@@ -132,13 +133,17 @@ def build_image(
         tag: Image tag to build
         containerfile_content: Containerfile content
         verbose: Show build output
+        cache_from: Image to use as a layer cache source
 
     Returns:
         True if build succeeded
     """
     import subprocess
 
-    cmd = [*manager.cmd_prefix, "build", "-t", tag, "-f", "-", "."]
+    cmd = [*manager.cmd_prefix, "build", "-t", tag]
+    if cache_from:
+        cmd.extend(["--cache-from", cache_from])
+    cmd.extend(["-f", "-", "."])
 
     if verbose:
         print_msg(f"Building image {tag}...")
@@ -176,9 +181,14 @@ def ensure_boost_image(
     pre_init_hooks: str = "",
     verbose: bool = False,
     force: bool = False,
+    cache_from: str | None = None,
+    pull_base: bool = False,
 ) -> str | None:
     """Ensure a boosted image exists, building if needed.
 
+    The boosted tag is checked first, so a cached image is found with a
+    single inspect and the base image is never looked at.
+
     Args:
         manager: Container manager
         base_image: Base image to build from
@@ -187,6 +197,9 @@ def ensure_boost_image(
         pre_init_hooks: Pre-init hooks command
         verbose: Show verbose output
         force: Force rebuild even if image exists
+        cache_from: Image to use as a layer cache source
+        pull_base: Pull the base image first if it is missing and a build
+            is needed
 
     Returns:
         Image tag if successful, None on failure
@@ -201,6 +214,12 @@ def ensure_boost_image(
             print_msg(f"Using existing boosted image: {tag}")
         return tag
 
+    if pull_base and not manager.image_exists(base_image):
+        print_error(f"Pulling base image: {base_image}")
+        if not manager.pull(base_image):
+            print_error(red(f"Failed to pull image: {base_image}"))
+            return None
+
     # Generate and build the Containerfile
     containerfile = generate_containerfile(
         base_image,
@@ -211,7 +230,7 @@ def ensure_boost_image(
 
     print_error(f"Building boosted image: {tag}")
 
-    if build_image(manager, tag, containerfile, verbose):
+    if build_image(manager, tag, containerfile, verbose, cache_from):
         print_error(f"Successfully built: {tag}")
         return tag
     else:
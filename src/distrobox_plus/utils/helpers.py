@@ -16,6 +16,27 @@ if TYPE_CHECKING:
 # RFC 1123: hostname max length is 64 characters
 MAX_HOSTNAME_LENGTH = 64
 
+# Host variables never passed to the container (see filter_env_for_container)
+_SKIP_ENV_VARS = frozenset(
+    {
+        "CONTAINER_ID",
+        "FPATH",
+        "HOST",
+        "HOSTNAME",
+        "HOME",
+        "PATH",
+        "PROFILEREAD",
+        "PWD",
+        "SHELL",
+        "XDG_SEAT",
+        "XDG_VTNR",
+        "_",
+    }
+)
+
+# Characters that make a variable's value unsafe to pass through
+_UNSAFE_ENV_CHARS = frozenset('"`$')
+
 
 class InvalidInputError(Exception):
     """Raised when user provides invalid input to a prompt."""
@@ -284,25 +305,10 @@ def filter_env_for_container() -> dict[str, str]:
     Returns:
         Dict of filtered environment variables
     """
-    skip_patterns = {
-        "CONTAINER_ID",
-        "FPATH",
-        "HOST",
-        "HOSTNAME",
-        "HOME",
-        "PATH",
-        "PROFILEREAD",
-        "PWD",
-        "SHELL",
-        "XDG_SEAT",
-        "XDG_VTNR",
-        "_",
-    }
-
     result: dict[str, str] = {}
     for key, value in os.environ.items():
         # Skip if matches pattern
-        if key in skip_patterns:
+        if key in _SKIP_ENV_VARS:
             continue
 
         # Skip variables starting with underscore (like original ^_)
@@ -314,7 +320,7 @@ def filter_env_for_container() -> dict[str, str]:
             continue
 
         # Skip if contains special characters
-        if any(c in value for c in ('"', "`", "$")):
+        if not _UNSAFE_ENV_CHARS.isdisjoint(value):
             continue
 
         result[key] = value
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import os
 import shutil
 import subprocess
+import sys
+import tempfile
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
 # Default test image - alpine is fast to pull and start
 DEFAULT_TEST_IMAGE = "alpine:latest"
@@ -21,6 +27,22 @@ DEFAULT_TEST_IMAGE = "alpine:latest"
 CONTAINER_NAME_PREFIX = "dbx-test"
 
 
+def unique_container_name(kind: str = "") -> str:
+    """Generate a unique test container name.
+
+    Under pytest-xdist the worker id is part of the name, so leftover
+    containers can be traced back to the worker that created them.
+    """
+    parts = [CONTAINER_NAME_PREFIX]
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        parts.append(worker)
+    if kind:
+        parts.append(kind)
+    parts.append(uuid.uuid4().hex[:8])
+    return "-".join(parts)
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add custom command line options."""
     parser.addoption(
@@ -43,6 +65,21 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Keep test containers after tests complete (for debugging)",
     )
+    parser.addoption(
+        "--podman-service",
+        action="store_true",
+        default=False,
+        help="Route podman calls through one shared `podman system service` "
+        "per session instead of a fresh runtime per CLI call",
+    )
+    parser.addoption(
+        "--storage-dir",
+        action="store",
+        default=None,
+        metavar="DIR",
+        help="Keep podman storage in a fresh directory under DIR for the session "
+        "(e.g. a tmpfs mount such as /dev/shm)",
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -51,20 +88,131 @@ def pytest_configure(config: pytest.Config) -> None:
     pass
 
 
+# Boosted image tags present before the session, for the cleanup at its end
+_BOOST_IMAGES_BEFORE = pytest.StashKey[set[str]]()
+
+
+def _list_boost_images(container_manager: str) -> set[str]:
+    """Return the boosted image tags currently in the local store."""
+    result = subprocess.run(
+        [container_manager, "images", "--format", "{{.Repository}}:{{.Tag}}"],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    return {line for line in result.stdout.split() if "-boost:" in line}
+
+
+def _session_container_manager(config: pytest.Config) -> str | None:
+    """Container manager for session-wide image cleanup, or None to skip it.
+
+    Cleanup runs once, in the process that owns the session: pytest-xdist
+    workers share one image store and must not remove images another worker
+    is still using. It needs an installed manager and is skipped with
+    --storage-dir, whose throwaway stores are removed wholesale. It does not
+    depend on DISTROBOX_SKIP_PREPULL: offline runs still build images.
+    """
+    if hasattr(config, "workerinput"):
+        return None
+    if config.getoption("--storage-dir") or not container_manager_available(config):
+        return None
+    manager = config.getoption("--container-manager")
+    return _detect_container_manager() if manager == "auto" else manager
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Snapshot boosted images so the ones built by the session can be removed."""
+    container_manager = _session_container_manager(session.config)
+    if container_manager is not None:
+        session.config.stash[_BOOST_IMAGES_BEFORE] = _list_boost_images(
+            container_manager
+        )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Remove boosted images built during the session with a single rmi.
+
+    Boosted images that existed before the session, and pulled base
+    images, are left alone. Honours --keep-containers.
+    """
+    before = session.config.stash.get(_BOOST_IMAGES_BEFORE, None)
+    container_manager = _session_container_manager(session.config)
+    if before is None or container_manager is None:
+        return
+
+    new_images = _list_boost_images(container_manager) - before
+    if not new_images:
+        return
+
+    if session.config.getoption("--keep-containers"):
+        print(f"\nKeeping images for debugging: {sorted(new_images)}")
+        return
+
+    subprocess.run(
+        [container_manager, "rmi", "-f", *sorted(new_images)],
+        check=False,
+        capture_output=True,
+    )
+
+
 def pytest_collection_modifyitems(
     config: pytest.Config, items: list[pytest.Item]
 ) -> None:
     """Modify test collection based on command line options."""
+    # Every test that can start the distrobox CLI goes through this fixture
+    for item in items:
+        if "distrobox" in item.fixturenames:
+            item.add_marker(pytest.mark.subprocess)
+
+    if config.pluginmanager.hasplugin("xdist"):
+        _add_xdist_groups(items)
+    if hasattr(config, "workerinput"):
+        _skip_all_containers(items)
+
     implementation = config.getoption("--implementation")
 
-    if implementation == "both":
-        return
+    # Deselect unwanted implementation variants before any fixture is set up
+    selected: list[pytest.Item] = []
+    deselected: list[pytest.Item] = []
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        variant = callspec.params.get("implementation") if callspec else None
+        if variant is not None and (
+            (implementation != "both" and variant != implementation)
+            or (variant == "original" and item.get_closest_marker("python_only"))
+        ):
+            deselected.append(item)
+        else:
+            selected.append(item)
 
-    # Filter tests to only run for the specified implementation
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def _add_xdist_groups(items: list[pytest.Item]) -> None:
+    """Group multi-distro tests by image for `pytest -n auto --dist=loadgroup`.
+
+    Tests for the same distro land on the same worker, so each worker pulls
+    and initializes a given base image once while distros run in parallel.
+    """
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "distro_image" in callspec.params:
+            item.add_marker(pytest.mark.xdist_group(callspec.params["distro_image"]))
+
+
+def _skip_all_containers(items: list[pytest.Item]) -> None:
+    """Skip all_containers tests on pytest-xdist workers.
+
+    Their --all operations would stop or remove containers that other
+    workers are still using. DistroboxImplementation.run refuses unmarked
+    --all calls on a worker, so a missing marker fails loudly.
+    """
+    skip = pytest.mark.skip(reason="acts on every container; not run under xdist")
     for item in items:
-        if "implementation" in item.fixturenames:
-            # The fixture will handle filtering
-            pass
+        if item.get_closest_marker("all_containers"):
+            item.add_marker(skip)
 
 
 @dataclass
@@ -93,12 +241,16 @@ class DistroboxImplementation:
 
     name: str  # "original" or "python"
     container_manager: str  # "podman" or "docker"
+    container_host: str | None = None  # podman service URL, if any
     _env: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Set up environment for the implementation."""
         self._env = os.environ.copy()
         self._env["DBX_CONTAINER_MANAGER"] = self.container_manager
+        if self.container_host:
+            # Makes every podman CLI call talk to the shared service
+            self._env["CONTAINER_HOST"] = self.container_host
 
     def _get_command_prefix(self, command: str) -> list[str]:
         """Get the command prefix for the implementation."""
@@ -117,6 +269,7 @@ class DistroboxImplementation:
         check: bool = False,
         timeout: int = 300,
         input_text: str | None = None,
+        capture: bool = True,
     ) -> CommandResult:
         """Run a distrobox command.
 
@@ -126,17 +279,25 @@ class DistroboxImplementation:
             check: If True, raise on non-zero exit code
             timeout: Command timeout in seconds
             input_text: Optional input to send to stdin
+            capture: If False, discard stdout for fire-and-forget calls;
+                stderr is still kept for diagnosing failures
 
         Returns:
             CommandResult with returncode, stdout, stderr
         """
         cmd = self._get_command_prefix(command)
         if args:
+            if "--all" in args and os.environ.get("PYTEST_XDIST_WORKER"):
+                pytest.fail(
+                    f"distrobox {command} --all would reach other xdist workers' "
+                    "containers; mark the test all_containers"
+                )
             cmd.extend(args)
 
         result = subprocess.run(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=self._env,
             timeout=timeout,
@@ -145,7 +306,7 @@ class DistroboxImplementation:
 
         cmd_result = CommandResult(
             returncode=result.returncode,
-            stdout=result.stdout,
+            stdout=result.stdout or "",
             stderr=result.stderr,
             command=cmd,
         )
@@ -160,6 +321,70 @@ class DistroboxImplementation:
 
         return cmd_result
 
+    def run_inprocess(
+        self,
+        command: str,
+        args: list[str] | None = None,
+        *,
+        check: bool = False,
+    ) -> CommandResult:
+        """Run a distrobox-plus command in this interpreter.
+
+        Only valid for the python implementation. Used for commands that
+        never touch the container manager, where forking a new interpreter
+        costs far more than the command itself.
+
+        Args:
+            command: The distrobox subcommand
+            args: Additional arguments to pass
+            check: If True, raise on non-zero exit code
+
+        Returns:
+            CommandResult with returncode, stdout, stderr
+        """
+        # unittest.mock is slow to import and only needed here
+        from unittest import mock
+
+        from distrobox_plus.cli import main
+
+        argv = [command, *(args or [])]
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        with (
+            mock.patch.dict(os.environ, self._env, clear=True),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            try:
+                returncode = main(argv)
+            except SystemExit as e:
+                # argparse exits on --help, --version and usage errors
+                if e.code is None:
+                    returncode = 0
+                elif isinstance(e.code, int):
+                    returncode = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+
+        cmd_result = CommandResult(
+            returncode=returncode,
+            stdout=stdout.getvalue(),
+            stderr=stderr.getvalue(),
+            command=["distrobox-plus", *argv],
+        )
+
+        if check and not cmd_result.success:
+            raise subprocess.CalledProcessError(
+                returncode,
+                cmd_result.command,
+                cmd_result.stdout,
+                cmd_result.stderr,
+            )
+
+        return cmd_result
+
     def create(self, name: str, **kwargs) -> CommandResult:
         """Create a distrobox container."""
         args = ["--name", name]
@@ -214,6 +439,18 @@ class DistroboxImplementation:
             **{k: v for k, v in kwargs.items() if k in ("check", "timeout")},
         )
 
+    def create_many(self, names: list[str], **kwargs) -> list[CommandResult]:
+        """Create several distrobox containers concurrently.
+
+        distrobox-create takes a single --name, so this overlaps one
+        create per container instead of running them back to back.
+
+        Returns:
+            One CommandResult per name, in the order of names.
+        """
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            return list(pool.map(lambda name: self.create(name, **kwargs), names))
+
     def enter(self, name: str, **kwargs) -> CommandResult:
         """Enter a distrobox container.
 
@@ -246,6 +483,15 @@ class DistroboxImplementation:
 
         return self.run("enter", args, **run_kwargs)
 
+    def enter_batch(self, name: str, commands: list[str], **kwargs) -> CommandResult:
+        """Run several shell commands in one container entry.
+
+        The commands are joined with && so the first failure stops the batch.
+        Only batch steps within one phase; keep lifecycle transitions
+        (create, stop, rm) as separate calls.
+        """
+        return self.enter(name, command=["sh", "-c", " && ".join(commands)], **kwargs)
+
     def list(self, **kwargs) -> CommandResult:
         """List distrobox containers."""
         args = []
@@ -279,7 +525,7 @@ class DistroboxImplementation:
         return self.run(
             "stop",
             args,
-            **{k: v for k, v in kwargs.items() if k in ("check", "timeout")},
+            **{k: v for k, v in kwargs.items() if k in ("check", "timeout", "capture")},
         )
 
     def rm(self, name: str | None = None, **kwargs) -> CommandResult:
@@ -303,7 +549,9 @@ class DistroboxImplementation:
             args.append(name)
 
         return self.run(
-            "rm", args, **{k: v for k, v in kwargs.items() if k in ("check", "timeout")}
+            "rm",
+            args,
+            **{k: v for k, v in kwargs.items() if k in ("check", "timeout", "capture")},
         )
 
     def build(self, **kwargs) -> CommandResult:
@@ -335,6 +583,17 @@ class DistroboxImplementation:
         if kwargs.get("verbose"):
             args.append("--verbose")
 
+        # Seed real builds from a pre-pulled layer cache image, if provided
+        cache_from = kwargs.get("cache_from") or os.environ.get(
+            "DISTROBOX_TEST_CACHE_FROM"
+        )
+        if cache_from and not kwargs.get("dry_run"):
+            args.extend(["--cache-from", cache_from])
+
+        if self.name == "python" and kwargs.get("dry_run"):
+            # Dry runs only render the Containerfile, no need to fork
+            return self.run_inprocess("build", args, check=kwargs.get("check", False))
+
         return self.run(
             "build",
             args,
@@ -346,6 +605,7 @@ class DistroboxImplementation:
         result = subprocess.run(
             [self.container_manager, "container", "exists", name],
             capture_output=True,
+            env=self._env,
         )
         return result.returncode == 0
 
@@ -355,17 +615,30 @@ class DistroboxImplementation:
             [self.container_manager, "inspect", "--format", "{{.State.Running}}", name],
             capture_output=True,
             text=True,
+            env=self._env,
         )
         return result.returncode == 0 and result.stdout.strip() == "true"
 
-    def force_remove_container(self, name: str) -> None:
-        """Force remove a container using the container manager directly."""
+    def force_remove_container(self, *names: str) -> None:
+        """Force remove containers using the container manager directly.
+
+        Several names are removed with a single rm call.
+        """
         subprocess.run(
-            [self.container_manager, "rm", "-f", name],
+            [self.container_manager, "rm", "-f", *names],
             capture_output=True,
+            env=self._env,
         )
 
 
+def container_manager_available(config: pytest.Config) -> bool:
+    """Whether the configured (or any auto-detected) manager is installed."""
+    manager = config.getoption("--container-manager")
+    if manager == "auto":
+        return any(shutil.which(m) for m in ("podman", "docker"))
+    return shutil.which(manager) is not None
+
+
 def _detect_container_manager() -> str:
     """Detect available container manager."""
     if shutil.which("podman"):
@@ -377,7 +650,42 @@ def _detect_container_manager() -> str:
 
 
 @pytest.fixture(scope="session")
-def container_manager(request: pytest.FixtureRequest) -> str:
+def _storage_conf(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """Point podman at a throwaway storage root under --storage-dir.
+
+    Layer commits then run at the speed of that filesystem, e.g. tmpfs.
+    The store starts empty, so images are pulled again in every session.
+    """
+    storage_dir = request.config.getoption("--storage-dir")
+    if not storage_dir:
+        yield
+        return
+
+    root = tempfile.mkdtemp(prefix="dbx-test-storage-", dir=storage_dir)
+    conf = os.path.join(root, "storage.conf")
+    with open(conf, "w") as f:
+        f.write(
+            "[storage]\n"
+            'driver = "overlay"\n'
+            f'graphroot = "{root}/graph"\n'
+            f'runroot = "{root}/run"\n'
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CONTAINERS_STORAGE_CONF", conf)
+        yield
+
+    if shutil.which("podman"):
+        # Layers are owned by subordinate ids, so remove them inside the
+        # user namespace
+        subprocess.run(
+            ["podman", "unshare", "rm", "-rf", root], check=False, capture_output=True
+        )
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def container_manager(request: pytest.FixtureRequest, _storage_conf: None) -> str:
     """Get the container manager to use for tests."""
     manager = request.config.getoption("--container-manager")
     if manager == "auto":
@@ -385,6 +693,45 @@ def container_manager(request: pytest.FixtureRequest) -> str:
     return manager
 
 
+@pytest.fixture(scope="session")
+def container_host(
+    request: pytest.FixtureRequest,
+    container_manager: str,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[str | None, None, None]:
+    """Start one long-running podman service for the whole session.
+
+    Only active with --podman-service and podman. Every podman CLI call then
+    reuses the warm service instead of re-reading storage and policy config.
+
+    Returns the CONTAINER_HOST URL, or None when disabled.
+    """
+    if not request.config.getoption("--podman-service") or (
+        container_manager != "podman"
+    ):
+        yield None
+        return
+
+    sock = tmp_path_factory.mktemp("podman-service") / "podman.sock"
+    url = f"unix://{sock}"
+    proc = subprocess.Popen(
+        ["podman", "system", "service", "--time=0", url],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        # Wait for the service to start listening
+        deadline = time.monotonic() + 10
+        while not sock.exists():
+            if proc.poll() is not None or time.monotonic() > deadline:
+                pytest.fail("podman system service failed to start")
+            time.sleep(0.05)
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
 @pytest.fixture(scope="session")
 def keep_containers(request: pytest.FixtureRequest) -> bool:
     """Whether to keep containers after tests."""
@@ -401,23 +748,24 @@ def _get_implementations(
     return [impl_option]
 
 
-@pytest.fixture(params=["original", "python"])
+@pytest.fixture(scope="session", params=["original", "python"])
 def implementation(
-    request: pytest.FixtureRequest, container_manager: str
+    request: pytest.FixtureRequest, container_manager: str, container_host: str | None
 ) -> DistroboxImplementation:
-    """Parameterized fixture that provides both implementations."""
-    impl_option = request.config.getoption("--implementation")
-
-    # Skip if this implementation is not selected
-    if impl_option != "both" and request.param != impl_option:
-        pytest.skip(f"Skipping {request.param} (--implementation={impl_option})")
+    """Parameterized fixture that provides both implementations.
 
+    Session-scoped because the wrapper holds no per-test state, which lets
+    class- and module-scoped fixtures build on it.
+    """
+    # Unselected variants are deselected in pytest_collection_modifyitems
     return DistroboxImplementation(
-        name=request.param, container_manager=container_manager
+        name=request.param,
+        container_manager=container_manager,
+        container_host=container_host,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def distrobox(implementation: DistroboxImplementation) -> DistroboxImplementation:
     """Alias for implementation fixture for cleaner test code."""
     return implementation
@@ -426,36 +774,37 @@ def distrobox(implementation: DistroboxImplementation) -> DistroboxImplementatio
 @pytest.fixture
 def test_container_name() -> str:
     """Generate a unique container name for testing."""
-    return f"{CONTAINER_NAME_PREFIX}-{uuid.uuid4().hex[:8]}"
+    return unique_container_name()
 
 
 @pytest.fixture
 def container_cleanup(
     distrobox: DistroboxImplementation, keep_containers: bool
-) -> Generator[list[str], None, None]:
+) -> Generator[set[str], None, None]:
     """Fixture that tracks and cleans up containers after tests.
 
     Usage:
         def test_something(distrobox, container_cleanup):
             name = "my-test-container"
-            container_cleanup.append(name)
+            container_cleanup.add(name)
             distrobox.create(name)
             # container will be cleaned up after test
     """
-    containers: list[str] = []
+    containers: set[str] = set()
     yield containers
 
     if keep_containers:
         if containers:
-            print(f"\nKeeping containers for debugging: {containers}")
+            print(f"\nKeeping containers for debugging: {sorted(containers)}")
         return
 
-    # Clean up containers in reverse order
-    for name in reversed(containers):
-        try:
-            distrobox.force_remove_container(name)
-        except Exception as e:
-            print(f"Warning: Failed to clean up container {name}: {e}")
+    if not containers:
+        return
+
+    try:
+        distrobox.force_remove_container(*sorted(containers))
+    except Exception as e:
+        print(f"Warning: Failed to clean up containers {sorted(containers)}: {e}")
 
 
 @pytest.fixture
@@ -468,12 +817,76 @@ def created_container(
 
     Returns the container name.
     """
-    container_cleanup.append(test_container_name)
+    container_cleanup.add(test_container_name)
     result = distrobox.create(test_container_name)
     assert result.success, f"Failed to create container: {result.stderr}"
     yield test_container_name
 
 
+@pytest.fixture
+def two_containers(
+    distrobox: DistroboxImplementation,
+    test_container_name: str,
+    container_cleanup: set[str],
+) -> tuple[str, str]:
+    """Create two containers concurrently and register them for cleanup.
+
+    Cleanup is harmless for containers the test removes itself.
+
+    Returns the two container names.
+    """
+    names = (f"{test_container_name}-1", f"{test_container_name}-2")
+    container_cleanup.update(names)
+    for name, result in zip(names, distrobox.create_many(list(names)), strict=True):
+        assert result.success, f"Failed to create container {name}: {result.stderr}"
+    return names
+
+
+@pytest.fixture(scope="session")
+def shared_container(
+    distrobox: DistroboxImplementation, keep_containers: bool
+) -> Generator[Callable[..., str], None, None]:
+    """Lazily create one initialized container per image for the session.
+
+    Only for tests that run commands inside the container without leaving
+    state behind; tests that stop, remove or otherwise mutate a container
+    must use created_container instead.
+
+    Usage:
+        def test_something(distrobox, shared_container):
+            name = shared_container()  # or shared_container("fedora:latest")
+            distrobox.enter(name, command="true")
+    """
+    containers: dict[str, str] = {}
+
+    def _get(image: str = DEFAULT_TEST_IMAGE) -> str:
+        if image not in containers:
+            name = unique_container_name("shared")
+            containers[image] = name
+            result = distrobox.create(name, image=image)
+            assert result.success, f"Failed to create container: {result.stderr}"
+            # First entry triggers initialization - pay it once per image
+            result = distrobox.enter(name, command="true", timeout=600)
+            assert result.success, f"Failed to initialize container: {result.stderr}"
+        return containers[image]
+
+    yield _get
+
+    if keep_containers:
+        if containers:
+            print(f"\nKeeping containers for debugging: {list(containers.values())}")
+        return
+
+    if not containers:
+        return
+
+    names = list(containers.values())
+    try:
+        distrobox.force_remove_container(*names)
+    except Exception as e:
+        print(f"Warning: Failed to clean up containers {names}: {e}")
+
+
 @pytest.fixture
 def initialized_container(
     distrobox: DistroboxImplementation,
@@ -7,9 +7,12 @@ from .assertions import (
     assert_container_not_exists,
     assert_container_not_in_list,
     assert_container_running,
+    assert_container_state,
     assert_container_stopped,
+    assert_contains_all,
     assert_output_contains,
     assert_output_matches,
+    assert_success_contains,
 )
 
 __all__ = [
@@ -20,7 +23,10 @@ __all__ = [
     "assert_container_not_exists",
     "assert_container_not_in_list",
     "assert_container_running",
+    "assert_container_state",
     "assert_container_stopped",
+    "assert_contains_all",
     "assert_output_contains",
     "assert_output_matches",
+    "assert_success_contains",
 ]
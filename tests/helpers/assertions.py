@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from tests.conftest import CommandResult, DistroboxImplementation
 
 __all__ = [
     "assert_command_success",
     "assert_command_failed",
+    "assert_success_contains",
     "assert_container_exists",
     "assert_container_not_exists",
     "assert_container_running",
@@ -19,8 +23,22 @@ __all__ = [
     "assert_output_matches",
     "assert_container_in_list",
     "assert_container_not_in_list",
+    "assert_contains_all",
+    "assert_container_state",
 ]
 
+# Running status as printed by the container manager ("Up 5 seconds")
+_UP_RE = re.compile(r"\bUp\b")
+
+# Characters that give a pattern regex meaning; anything else is a literal
+_META = frozenset(r".^$*+?{}[]|()\\")
+
+
+@functools.lru_cache(maxsize=128)
+def _get_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile and cache a regex pattern."""
+    return re.compile(pattern)
+
 
 def assert_command_success(result: CommandResult, msg: str | None = None) -> None:
     """Assert that a command succeeded."""
@@ -32,6 +50,14 @@ def assert_command_success(result: CommandResult, msg: str | None = None) -> Non
         raise AssertionError(error_msg)
 
 
+def assert_success_contains(result: CommandResult, *needles: str) -> None:
+    """Assert that a command succeeded and its stdout contains every needle."""
+    assert_command_success(result)
+    missing = [needle for needle in needles if needle not in result.stdout]
+    if missing:
+        raise AssertionError(f"Expected {missing} in stdout, but got:\n{result.stdout}")
+
+
 def assert_command_failed(
     result: CommandResult, expected_code: int | None = None, msg: str | None = None
 ) -> None:
@@ -89,7 +115,12 @@ def assert_output_matches(
 ) -> None:
     """Assert that command output matches a regex pattern."""
     output = result.stderr if in_stderr else result.stdout
-    if not re.search(pattern, output):
+    if _META.isdisjoint(pattern):
+        # Literal pattern: a plain substring scan is equivalent and cheaper
+        matched = pattern in output
+    else:
+        matched = _get_pattern(pattern).search(output) is not None
+    if not matched:
         source = "stderr" if in_stderr else "stdout"
         raise AssertionError(
             f"Expected pattern '{pattern}' to match {source}, but got:\n{output}"
@@ -111,3 +142,70 @@ def assert_container_not_in_list(result: CommandResult, name: str) -> None:
         raise AssertionError(
             f"Container '{name}' unexpectedly found in list output:\n{result.stdout}"
         )
+
+
+def assert_contains_all(items: Iterable[str], expected: Iterable[str]) -> None:
+    """Assert that every expected item is present, reporting all missing ones."""
+    items = list(items)
+    missing = set(expected).difference(items)
+    if missing:
+        raise AssertionError(f"Missing {sorted(missing)} from {items}")
+
+
+def _list_row_fields(line: str) -> list[str]:
+    """Split a distrobox list row into its ID | NAME | STATUS | IMAGE fields.
+
+    The original implementation separates columns with '|'; the Python one
+    prints a borderless table, so whitespace separates them there.
+    """
+    if "|" in line:
+        return [field.strip() for field in line.split("|")]
+    return line.split()
+
+
+def assert_container_state(
+    distrobox: DistroboxImplementation,
+    name: str,
+    *,
+    exists: bool,
+    running: bool | None = None,
+) -> CommandResult:
+    """Assert a container's existence and, optionally, its running state.
+
+    Both checks are made against a single distrobox list call. Rows are
+    matched on the NAME column exactly, so a name that prefixes another
+    (box vs box-1) cannot pick the wrong row; the columns after it hold
+    the status.
+
+    Returns:
+        The list result, for further assertions.
+    """
+    result = distrobox.list()
+    assert_command_success(result)
+
+    row = next(
+        (
+            fields
+            for fields in map(_list_row_fields, result.stdout.splitlines())
+            if len(fields) > 1 and fields[1] == name
+        ),
+        None,
+    )
+    if not exists:
+        if row is not None:
+            raise AssertionError(
+                f"Container '{name}' unexpectedly found in list output:\n"
+                f"{result.stdout}"
+            )
+        return result
+
+    if row is None:
+        raise AssertionError(
+            f"Container '{name}' not found in list output:\n{result.stdout}"
+        )
+    if running is not None:
+        is_up = _UP_RE.search(" ".join(row[2:])) is not None
+        if is_up != running:
+            state = "not running" if running else "still running"
+            raise AssertionError(f"Container '{name}' is {state}:\n{' | '.join(row)}")
+    return result
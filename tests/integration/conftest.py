@@ -2,27 +2,40 @@
 
 from __future__ import annotations
 
+import json
 import os
+import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
 
+from distrobox_plus.utils.builder import get_boost_image_tag
+from tests.conftest import (
+    DEFAULT_TEST_IMAGE,
+    DistroboxImplementation,
+    container_manager_available,
+)
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+
+    from tests.conftest import CommandResult
 
 # Mark all tests in this directory as integration tests
 pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
+# Mount sources are only read by the tests, so share them across a class
+@pytest.fixture(scope="class")
 def temp_home() -> Generator[str, None, None]:
     """Create a temporary home directory for testing."""
     with tempfile.TemporaryDirectory(prefix="dbx-test-home-") as tmpdir:
         yield tmpdir
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def temp_volume() -> Generator[str, None, None]:
     """Create a temporary directory to use as a volume mount."""
     with tempfile.TemporaryDirectory(prefix="dbx-test-vol-") as tmpdir:
@@ -33,6 +46,16 @@ def temp_volume() -> Generator[str, None, None]:
         yield tmpdir
 
 
+@pytest.fixture(scope="class")
+def two_volumes() -> Generator[tuple[str, str], None, None]:
+    """Create two temporary directories to use as volume mounts."""
+    with (
+        tempfile.TemporaryDirectory(prefix="dbx-test-vol-") as vol1,
+        tempfile.TemporaryDirectory(prefix="dbx-test-vol-") as vol2,
+    ):
+        yield vol1, vol2
+
+
 # Common test images
 DISTRO_IMAGES = {
     "alpine": "alpine:latest",
@@ -50,3 +73,122 @@ def distro_image(request: pytest.FixtureRequest) -> tuple[str, str]:
     Returns (distro_name, image_name) tuple.
     """
     return request.param, DISTRO_IMAGES[request.param]
+
+
+# Images used by fast tests; always pre-pulled
+FAST_TEST_IMAGES = (DEFAULT_TEST_IMAGE, "alpine:3.18")
+
+# Fixtures through which a test creates containers, and so needs images
+_CONTAINER_FIXTURES = frozenset(
+    {
+        "test_container_name",
+        "container_cleanup",
+        "created_container",
+        "two_containers",
+        "shared_container",
+        "initialized_container",
+        "running_container",
+        "template_image",
+    }
+)
+
+
+def _needs_images(request: pytest.FixtureRequest) -> bool:
+    """Whether session-wide image handling should run at all.
+
+    False when opted out with DISTROBOX_SKIP_PREPULL, when no selected test
+    creates containers, or when no container manager is installed. The
+    session fixtures then do nothing, so parser and help tests still run.
+    """
+    if os.environ.get("DISTROBOX_SKIP_PREPULL"):
+        return False
+    if not any(
+        _CONTAINER_FIXTURES.intersection(item.fixturenames)
+        for item in request.session.items
+    ):
+        return False
+    return container_manager_available(request.config)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prepull_images(request: pytest.FixtureRequest) -> None:
+    """Pull every test image once per session instead of inside each test.
+
+    Nothing is pulled unless a selected test creates containers and a
+    container manager is installed; the full distro matrix is only pulled
+    when slow tests are selected.
+    Set DISTROBOX_SKIP_PREPULL=1 to skip this (e.g. for offline runs).
+    """
+    if not _needs_images(request):
+        return
+
+    items = request.session.items
+    container_manager = request.getfixturevalue("container_manager")
+
+    images = list(FAST_TEST_IMAGES)
+    if any(item.get_closest_marker("slow") for item in items):
+        images.extend(i for i in DISTRO_IMAGES.values() if i not in images)
+
+    # Pulls are network bound, so overlap them
+    with ThreadPoolExecutor(max_workers=len(images)) as pool:
+        for image in images:
+            pool.submit(
+                subprocess.run,
+                [container_manager, "pull", image],
+                check=False,
+                capture_output=True,
+            )
+
+
+@pytest.fixture(scope="session")
+def template_image(
+    container_manager: str,
+    container_host: str | None,
+) -> str:
+    """Build one boosted DEFAULT_TEST_IMAGE for the session.
+
+    Containers created from it skip the package installation of the first
+    entry. Only for tests that are not about distrobox initialization itself.
+    Build is python-only, so this always uses the python implementation;
+    the boosted image cleanup at session end removes the image afterwards.
+
+    Returns the boosted image tag.
+    """
+    builder = DistroboxImplementation(
+        name="python",
+        container_manager=container_manager,
+        container_host=container_host,
+    )
+    result = builder.build(image=DEFAULT_TEST_IMAGE, timeout=600)
+    assert result.success, f"Failed to build template image: {result.stderr}"
+    return get_boost_image_tag(DEFAULT_TEST_IMAGE)
+
+
+@pytest.fixture(scope="session")
+def _dry_run_build_cache() -> dict[tuple[str, str], CommandResult]:
+    """Session-wide store for dry-run build results."""
+    return {}
+
+
+@pytest.fixture
+def dry_run_build(
+    distrobox: DistroboxImplementation,
+    _dry_run_build_cache: dict[tuple[str, str], CommandResult],
+) -> Callable[..., CommandResult]:
+    """Run `distrobox build --dry-run`, memoized per implementation and args.
+
+    Dry-run output is deterministic, so only the first call with a given set
+    of arguments spawns a subprocess.
+
+    Usage:
+        def test_something(dry_run_build):
+            result = dry_run_build(image="alpine:latest")
+    """
+
+    def _run(**kwargs: object) -> CommandResult:
+        key = (distrobox.name, json.dumps(kwargs, sort_keys=True, default=str))
+        if key not in _dry_run_build_cache:
+            _dry_run_build_cache[key] = distrobox.build(dry_run=True, **kwargs)
+        return _dry_run_build_cache[key]
+
+    return _run
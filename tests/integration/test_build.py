@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
-import subprocess
+import re
 
 import pytest
 
+from tests.conftest import DistroboxImplementation
 from tests.helpers.assertions import (
     assert_command_failed,
     assert_command_success,
 )
 
-pytestmark = [pytest.mark.integration, pytest.mark.build]
+pytestmark = [pytest.mark.integration, pytest.mark.build, pytest.mark.python_only]
+
+# Tag line printed at the end of a dry run
+_TAG_LINE_RE = re.compile(r"Would be tagged as:.*?(\S+-boost:\S+)")
+
+# Sections every alpine dry-run Containerfile must contain
+_DRY_RUN_MARKERS = frozenset(
+    {
+        "FROM alpine:latest",
+        "/.distrobox-boost",
+        "# Upgrade existing packages",
+        "# Install distrobox dependencies",
+    }
+)
+_DRY_RUN_RE = re.compile("|".join(map(re.escape, sorted(_DRY_RUN_MARKERS))))
 
 
 class TestBuildHelp:
@@ -20,10 +35,6 @@ class TestBuildHelp:
     @pytest.mark.fast
     def test_build_version(self, distrobox):
         """Test build --version output."""
-        # Build is python-only command
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
         result = distrobox.run("build", ["--version"])
         assert_command_success(result)
         assert "distrobox" in result.output.lower()
@@ -35,186 +46,152 @@ class TestBuildParser:
     @pytest.mark.fast
     def test_parser_image_required(self, distrobox):
         """Test that --image is required."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
         result = distrobox.build()
         assert_command_failed(result)
 
     @pytest.mark.fast
-    def test_parser_dry_run_flag(self, distrobox):
+    def test_parser_dry_run_flag(self, distrobox, dry_run_build):
         """Test --dry-run flag."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(image="alpine:latest", dry_run=True)
+        result = dry_run_build(image="alpine:latest")
         assert_command_success(result)
         assert "FROM alpine:latest" in result.output
 
     @pytest.mark.fast
-    def test_parser_additional_packages(self, distrobox):
+    def test_parser_additional_packages(self, distrobox, dry_run_build):
         """Test --additional-packages flag."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(
+        result = dry_run_build(
             image="alpine:latest",
             additional_packages=["git", "vim"],
-            dry_run=True,
         )
         assert_command_success(result)
         assert "git vim" in result.output
 
     @pytest.mark.fast
-    def test_parser_init_hooks(self, distrobox):
+    def test_parser_init_hooks(self, distrobox, dry_run_build):
         """Test --init-hooks flag."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(
+        result = dry_run_build(
             image="alpine:latest",
             init_hooks="touch /tmp/test",
-            dry_run=True,
         )
         assert_command_success(result)
         assert "touch /tmp/test" in result.output
         assert "# Init hooks" in result.output
 
     @pytest.mark.fast
-    def test_parser_pre_init_hooks(self, distrobox):
+    def test_parser_pre_init_hooks(self, distrobox, dry_run_build):
         """Test --pre-init-hooks flag."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(
+        result = dry_run_build(
             image="alpine:latest",
             pre_init_hooks="echo hello",
-            dry_run=True,
         )
         assert_command_success(result)
         assert "echo hello" in result.output
         assert "# Pre-init hooks" in result.output
 
+    @pytest.mark.fast
+    def test_parser_cache_from(self, distrobox):
+        """Test --cache-from flag is accepted."""
+        result = distrobox.run_inprocess(
+            "build",
+            ["--image", "alpine:latest", "--cache-from", "alpine:cache", "--dry-run"],
+        )
+        assert_command_success(result)
+
 
 class TestBuildDryRun:
     """Dry-run mode tests."""
 
     @pytest.mark.fast
-    def test_dry_run_shows_containerfile(self, distrobox):
+    def test_dry_run_shows_containerfile(self, distrobox, dry_run_build):
         """Test that dry-run shows the Containerfile."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(image="alpine:latest", dry_run=True)
+        result = dry_run_build(image="alpine:latest")
         assert_command_success(result)
-        assert "FROM alpine:latest" in result.output
-        assert "/.distrobox-boost" in result.output
-        assert "# Upgrade existing packages" in result.output
-        assert "# Install distrobox dependencies" in result.output
+        assert set(_DRY_RUN_RE.findall(result.output)) == _DRY_RUN_MARKERS
 
     @pytest.mark.fast
-    def test_dry_run_shows_tag(self, distrobox):
+    def test_dry_run_shows_tag(self, distrobox, dry_run_build):
         """Test that dry-run shows the image tag."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(image="alpine:latest", dry_run=True)
+        result = dry_run_build(image="alpine:latest")
         assert_command_success(result)
-        assert "Would be tagged as:" in result.output
-        assert "-boost:" in result.output
+        assert _TAG_LINE_RE.search(result.output) is not None
 
     @pytest.mark.fast
-    def test_dry_run_different_packages_different_tags(self, distrobox):
+    def test_dry_run_different_packages_different_tags(self, distrobox, dry_run_build):
         """Test that different packages produce different tags."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result1 = distrobox.build(
+        result1 = dry_run_build(
             image="alpine:latest",
             additional_packages=["git"],
-            dry_run=True,
         )
-        result2 = distrobox.build(
+        result2 = dry_run_build(
             image="alpine:latest",
             additional_packages=["vim"],
-            dry_run=True,
         )
         assert_command_success(result1)
         assert_command_success(result2)
 
-        # Extract tags
-        tag1 = [
-            line for line in result1.output.split("\n") if "Would be tagged" in line
-        ][0]
-        tag2 = [
-            line for line in result2.output.split("\n") if "Would be tagged" in line
-        ][0]
-        assert tag1 != tag2
+        match1 = _TAG_LINE_RE.search(result1.output)
+        match2 = _TAG_LINE_RE.search(result2.output)
+        assert match1 is not None
+        assert match2 is not None
+        assert match1.group(1) != match2.group(1)
 
 
 class TestBuildContainerfile:
     """Containerfile generation tests."""
 
     @pytest.mark.fast
-    def test_containerfile_has_boost_marker(self, distrobox):
+    def test_containerfile_has_boost_marker(self, distrobox, dry_run_build):
         """Test that Containerfile creates boost marker."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(image="fedora:latest", dry_run=True)
+        result = dry_run_build(image="fedora:latest")
         assert_command_success(result)
         assert "touch /.distrobox-boost" in result.output
 
     @pytest.mark.fast
-    def test_containerfile_handles_apk(self, distrobox):
-        """Test that Containerfile handles apk package manager."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(image="alpine:latest", dry_run=True)
+    @pytest.mark.parametrize(
+        ("image", "needle"),
+        [
+            ("alpine:latest", "command -v apk"),
+            ("ubuntu:22.04", "command -v apt-get"),
+            ("fedora:latest", "command -v dnf"),
+            ("archlinux:latest", "command -v pacman"),
+        ],
+        ids=["apk", "apt", "dnf", "pacman"],
+    )
+    def test_containerfile_handles_pkg_manager(
+        self, distrobox, dry_run_build, image, needle
+    ):
+        """Test that Containerfile handles the image's package manager."""
+        result = dry_run_build(image=image)
         assert_command_success(result)
-        assert "command -v apk" in result.output
-
-    @pytest.mark.fast
-    def test_containerfile_handles_apt(self, distrobox):
-        """Test that Containerfile handles apt package manager."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
+        assert needle in result.output
 
-        result = distrobox.build(image="ubuntu:22.04", dry_run=True)
-        assert_command_success(result)
-        assert "command -v apt-get" in result.output
 
-    @pytest.mark.fast
-    def test_containerfile_handles_dnf(self, distrobox):
-        """Test that Containerfile handles dnf package manager."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        result = distrobox.build(image="fedora:latest", dry_run=True)
-        assert_command_success(result)
-        assert "command -v dnf" in result.output
+@pytest.fixture(scope="module")
+def first_alpine_build(container_manager, container_host):
+    """Build alpine:latest with curl once and share it across the module.
 
-    @pytest.mark.fast
-    def test_containerfile_handles_pacman(self, distrobox):
-        """Test that Containerfile handles pacman package manager."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
+    The config differs from test_build_alpine_image's, so that test always
+    builds rather than being served from this cached image.
 
-        result = distrobox.build(image="archlinux:latest", dry_run=True)
-        assert_command_success(result)
-        assert "command -v pacman" in result.output
+    Build is python-only, so this always uses the python implementation.
+    The image is removed by the boosted image cleanup at session end.
+    """
+    distrobox = DistroboxImplementation(
+        name="python",
+        container_manager=container_manager,
+        container_host=container_host,
+    )
+    return distrobox.build(
+        image="alpine:latest", additional_packages=["curl"], timeout=600
+    )
 
 
 class TestBuildActual:
     """Actual build tests (requires container runtime)."""
 
     @pytest.mark.slow
-    def test_build_alpine_image(self, distrobox, container_manager):
+    def test_build_alpine_image(self, distrobox):
         """Test actually building an alpine image."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
         result = distrobox.build(
             image="alpine:latest",
             timeout=600,
@@ -222,25 +199,9 @@ class TestBuildActual:
         assert_command_success(result)
         assert "Successfully built" in result.output or "Built image" in result.output
 
-        # Extract tag from output and verify image exists
-        # Clean up the built image
-        for line in result.output.split("\n"):
-            if "-boost:" in line:
-                # Extract tag
-                import re
-
-                match = re.search(r"(\S+-boost:\S+)", line)
-                if match:
-                    tag = match.group(1)
-                    subprocess.run([container_manager, "rmi", tag], capture_output=True)
-                    break
-
     @pytest.mark.slow
-    def test_build_with_additional_packages(self, distrobox, container_manager):
+    def test_build_with_additional_packages(self, distrobox):
         """Test building with additional packages."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
         result = distrobox.build(
             image="alpine:latest",
             additional_packages=["git"],
@@ -248,80 +209,31 @@ class TestBuildActual:
         )
         assert_command_success(result)
 
-        # Clean up
-        for line in result.output.split("\n"):
-            if "-boost:" in line:
-                import re
-
-                match = re.search(r"(\S+-boost:\S+)", line)
-                if match:
-                    tag = match.group(1)
-                    subprocess.run([container_manager, "rmi", tag], capture_output=True)
-                    break
-
     @pytest.mark.slow
-    def test_build_caching(self, distrobox, container_manager):
+    def test_build_caching(self, distrobox, first_alpine_build):
         """Test that building same config twice uses cache."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        # First build
-        result1 = distrobox.build(
-            image="alpine:latest",
-            additional_packages=["curl"],
-            timeout=600,
-        )
-        assert_command_success(result1)
+        assert_command_success(first_alpine_build)
 
         # Second build should detect existing image
-        result2 = distrobox.build(
+        result = distrobox.build(
             image="alpine:latest",
             additional_packages=["curl"],
             timeout=60,
         )
-        assert_command_success(result2)
+        assert_command_success(result)
         # Should indicate using existing image or be much faster
 
-        # Clean up
-        for line in result1.output.split("\n"):
-            if "-boost:" in line:
-                import re
-
-                match = re.search(r"(\S+-boost:\S+)", line)
-                if match:
-                    tag = match.group(1)
-                    subprocess.run([container_manager, "rmi", tag], capture_output=True)
-                    break
-
     @pytest.mark.slow
-    def test_build_force_rebuild(self, distrobox, container_manager):
+    def test_build_force_rebuild(self, distrobox, first_alpine_build):
         """Test --force flag rebuilds even when image exists."""
-        if distrobox.name == "original":
-            pytest.skip("build command is python-only")
-
-        # First build
-        result1 = distrobox.build(
-            image="alpine:latest",
-            timeout=600,
-        )
-        assert_command_success(result1)
+        assert_command_success(first_alpine_build)
 
         # Force rebuild
-        result2 = distrobox.build(
+        result = distrobox.build(
             image="alpine:latest",
+            additional_packages=["curl"],
             force=True,
             timeout=600,
         )
-        assert_command_success(result2)
-        assert "Building boosted image" in result2.output
-
-        # Clean up
-        for line in result1.output.split("\n"):
-            if "-boost:" in line:
-                import re
-
-                match = re.search(r"(\S+-boost:\S+)", line)
-                if match:
-                    tag = match.group(1)
-                    subprocess.run([container_manager, "rmi", tag], capture_output=True)
-                    break
+        assert_command_success(result)
+        assert "Building boosted image" in result.output
@@ -22,7 +22,7 @@ class TestCreateBasic:
         self, distrobox, test_container_name, container_cleanup
     ):
         """Test creating a container with the default alpine image."""
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
 
         result = distrobox.create(test_container_name)
 
@@ -34,7 +34,7 @@ class TestCreateBasic:
         self, distrobox, test_container_name, container_cleanup
     ):
         """Test creating a container with a specific image."""
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
 
         result = distrobox.create(test_container_name, image="alpine:3.18")
 
@@ -46,7 +46,7 @@ class TestCreateBasic:
         self, distrobox, test_container_name, container_cleanup
     ):
         """Test creating a container with a custom hostname."""
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
         custom_hostname = "my-test-host"
 
         result = distrobox.create(test_container_name, hostname=custom_hostname)
@@ -64,7 +64,7 @@ class TestCreateBasic:
         self, distrobox, test_container_name, container_cleanup, temp_home
     ):
         """Test creating a container with a custom home directory."""
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
 
         result = distrobox.create(test_container_name, home=temp_home)
 
@@ -80,7 +80,7 @@ class TestCreateVolumes:
         self, distrobox, test_container_name, container_cleanup, temp_volume
     ):
         """Test creating a container with an additional volume mount."""
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
         mount_point = "/mnt/test-volume"
 
         result = distrobox.create(
@@ -99,24 +99,19 @@ class TestCreateVolumes:
 
     @pytest.mark.fast
     def test_create_with_multiple_volumes(
-        self, distrobox, test_container_name, container_cleanup
+        self, distrobox, test_container_name, container_cleanup, two_volumes
     ):
         """Test creating a container with multiple volume mounts."""
-        import tempfile
-
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
+        vol1, vol2 = two_volumes
 
-        with (
-            tempfile.TemporaryDirectory() as vol1,
-            tempfile.TemporaryDirectory() as vol2,
-        ):
-            result = distrobox.create(
-                test_container_name,
-                volume=[f"{vol1}:/mnt/vol1", f"{vol2}:/mnt/vol2"],
-            )
+        result = distrobox.create(
+            test_container_name,
+            volume=[f"{vol1}:/mnt/vol1", f"{vol2}:/mnt/vol2"],
+        )
 
-            assert_command_success(result)
-            assert_container_exists(distrobox, test_container_name)
+        assert_command_success(result)
+        assert_container_exists(distrobox, test_container_name)
 
 
 class TestCreatePackages:
@@ -127,7 +122,7 @@ class TestCreatePackages:
         self, distrobox, test_container_name, container_cleanup
     ):
         """Test creating a container with additional packages installed."""
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
 
         result = distrobox.create(
             test_container_name,
@@ -152,7 +147,7 @@ class TestCreateMultiDistro:
         """Test creating containers with different distributions."""
         distro_name, image = distro_image
         container_name = f"{test_container_name}-{distro_name}"
-        container_cleanup.append(container_name)
+        container_cleanup.add(container_name)
 
         result = distrobox.create(container_name, image=image, timeout=600)
 
@@ -189,7 +184,7 @@ class TestCreateErrors:
         Note: distrobox doesn't fail on duplicate names - it detects the container
         exists and returns success with a message indicating so.
         """
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
 
         # Create first container
         result1 = distrobox.create(test_container_name)
@@ -206,7 +201,7 @@ class TestCreateErrors:
         self, distrobox, test_container_name, container_cleanup
     ):
         """Test that creating with a non-existent image fails."""
-        container_cleanup.append(test_container_name)
+        container_cleanup.add(test_container_name)
 
         result = distrobox.create(
             test_container_name,
@@ -221,49 +216,17 @@ class TestCreateUnshare:
     """Namespace unsharing tests."""
 
     @pytest.mark.fast
-    def test_create_with_unshare_ipc(
-        self, distrobox, test_container_name, container_cleanup
-    ):
-        """Test creating a container with unshared IPC namespace."""
-        container_cleanup.append(test_container_name)
-
-        result = distrobox.create(test_container_name, unshare_ipc=True)
-
-        assert_command_success(result)
-        assert_container_exists(distrobox, test_container_name)
-
-    @pytest.mark.fast
-    def test_create_with_unshare_netns(
-        self, distrobox, test_container_name, container_cleanup
-    ):
-        """Test creating a container with unshared network namespace."""
-        container_cleanup.append(test_container_name)
-
-        result = distrobox.create(test_container_name, unshare_netns=True)
-
-        assert_command_success(result)
-        assert_container_exists(distrobox, test_container_name)
-
-    @pytest.mark.fast
-    def test_create_with_unshare_process(
-        self, distrobox, test_container_name, container_cleanup
-    ):
-        """Test creating a container with unshared process namespace."""
-        container_cleanup.append(test_container_name)
-
-        result = distrobox.create(test_container_name, unshare_process=True)
-
-        assert_command_success(result)
-        assert_container_exists(distrobox, test_container_name)
-
-    @pytest.mark.fast
-    def test_create_with_unshare_all(
-        self, distrobox, test_container_name, container_cleanup
+    @pytest.mark.parametrize(
+        "unshare_flag",
+        ["unshare_ipc", "unshare_netns", "unshare_process", "unshare_all"],
+    )
+    def test_create_with_unshare(
+        self, distrobox, test_container_name, container_cleanup, unshare_flag
     ):
-        """Test creating a container with all namespaces unshared."""
-        container_cleanup.append(test_container_name)
+        """Test creating a container with unshared namespaces."""
+        container_cleanup.add(test_container_name)
 
-        result = distrobox.create(test_container_name, unshare_all=True)
+        result = distrobox.create(test_container_name, **{unshare_flag: True})
 
         assert_command_success(result)
         assert_container_exists(distrobox, test_container_name)
@@ -15,6 +15,34 @@ from tests.helpers.assertions import (
 # All enter tests are slow because first entry triggers container initialization
 pytestmark = [pytest.mark.integration, pytest.mark.enter, pytest.mark.slow]
 
+# One shell round-trip gathering what the user/environment/workdir tests check.
+# The marker line separates the probe from any output printed on first entry.
+_PROBE_MARKER = "---dbx-probe---"
+_PROBE_FIELDS = ("user", "uid", "home", "term", "path", "cwd")
+_PROBE_SCRIPT = (
+    f'echo "{_PROBE_MARKER}"; whoami; id -u; '
+    'echo "$HOME"; echo "$TERM"; echo "$PATH"; pwd'
+)
+
+
+@pytest.fixture
+def created_container(shared_container):
+    """Enter tests only run commands, so they share one initialized container."""
+    return shared_container()
+
+
+@pytest.fixture(scope="module")
+def enter_probe(distrobox, shared_container):
+    """Run the probe script once and parse its output.
+
+    Returns a dict keyed by _PROBE_FIELDS.
+    """
+    result = distrobox.enter(shared_container(), command=["sh", "-c", _PROBE_SCRIPT])
+    assert_command_success(result)
+
+    lines = result.stdout.split(_PROBE_MARKER, 1)[1].splitlines()[1:]
+    return dict(zip(_PROBE_FIELDS, lines[: len(_PROBE_FIELDS)], strict=True))
+
 
 class TestEnterBasic:
     """Basic container entry tests."""
@@ -50,68 +78,47 @@ class TestEnterBasic:
 class TestEnterUser:
     """User-related tests."""
 
-    def test_enter_username_matches_host(self, distrobox, created_container):
+    def test_enter_username_matches_host(self, enter_probe):
         """Test that username inside container matches host username."""
         host_user = pwd.getpwuid(os.getuid()).pw_name
 
-        result = distrobox.enter(created_container, command="whoami")
+        assert host_user in enter_probe["user"]
 
-        assert_command_success(result)
-        assert host_user in result.stdout
-
-    def test_enter_uid_matches_host(self, distrobox, created_container):
+    def test_enter_uid_matches_host(self, enter_probe):
         """Test that UID inside container matches host UID."""
         host_uid = os.getuid()
 
-        result = distrobox.enter(created_container, command="id -u")
+        assert str(host_uid) in enter_probe["uid"]
 
-        assert_command_success(result)
-        assert str(host_uid) in result.stdout
-
-    def test_enter_home_directory(self, distrobox, created_container):
+    def test_enter_home_directory(self, enter_probe):
         """Test that home directory is accessible."""
-        result = distrobox.enter(created_container, command="echo $HOME")
-
-        assert_command_success(result)
         # Home should be set to something
-        assert result.stdout.strip() != ""
+        assert enter_probe["home"].strip() != ""
 
 
 class TestEnterEnvironment:
     """Environment variable tests."""
 
-    def test_enter_env_forwarding(self, distrobox, created_container):
+    def test_enter_env_forwarding(self, enter_probe):
         """Test that environment variables are forwarded to container."""
         # Note: distrobox forwards many environment variables
         # Test with a common one like TERM
-        result = distrobox.enter(created_container, command="echo $TERM")
-
-        assert_command_success(result)
-        # TERM should be forwarded
-        assert result.stdout.strip() != ""
+        assert enter_probe["term"].strip() != ""
 
-    def test_enter_path_includes_host_paths(self, distrobox, created_container):
+    def test_enter_path_includes_host_paths(self, enter_probe):
         """Test that PATH includes relevant paths."""
-        result = distrobox.enter(created_container, command="echo $PATH")
-
-        assert_command_success(result)
         # PATH should be set and contain standard paths
-        assert "/usr/bin" in result.stdout or "/bin" in result.stdout
+        assert "/usr/bin" in enter_probe["path"] or "/bin" in enter_probe["path"]
 
 
 class TestEnterWorkingDirectory:
     """Working directory tests."""
 
-    def test_enter_preserves_workdir(self, distrobox, created_container):
+    def test_enter_preserves_workdir(self, enter_probe):
         """Test that current working directory is preserved."""
-        _host_cwd = os.getcwd()  # noqa: F841
-
-        result = distrobox.enter(created_container, command="pwd")
-
-        assert_command_success(result)
         # Working directory should match host (if path exists in container)
         # or be in the container's home
-        assert result.stdout.strip() != ""
+        assert enter_probe["cwd"].strip() != ""
 
     def test_enter_no_workdir_flag(self, distrobox, created_container):
         """Test --no-workdir flag uses container's home."""
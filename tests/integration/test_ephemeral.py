@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import FrozenInstanceError, replace
 
 import pytest
 
@@ -18,9 +19,28 @@ from distrobox_plus.commands.ephemeral import (
     generate_ephemeral_name,
 )
 from distrobox_plus.config import Config
+from tests.helpers.assertions import assert_contains_all
 
 pytestmark = [pytest.mark.integration, pytest.mark.ephemeral]
 
+# Generated name format: distrobox-XXXXXXXXXX (mktemp uses [A-Za-z0-9])
+_NAME_RE = re.compile(r"distrobox-[A-Za-z0-9]{10}")
+
+
+# Baseline options; tests derive variants with dataclasses.replace()
+_BASE_OPTS = EphemeralOptions(name="test")
+
+
+def _pair(args: list[str], flag: str) -> str:
+    """Return the value that follows flag in an argument list."""
+    return args[args.index(flag) + 1]
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Shared ephemeral parser; parse_known_args does not mutate it."""
+    return create_parser()
+
 
 class TestEphemeralNameGeneration:
     """Test ephemeral name generation."""
@@ -30,16 +50,15 @@ class TestEphemeralNameGeneration:
         """Test that generated names match expected format."""
         name = generate_ephemeral_name()
 
-        # Should match distrobox-XXXXXXXXXX pattern (mktemp uses [A-Za-z0-9])
-        assert re.match(r"^distrobox-[A-Za-z0-9]{10}$", name)
+        assert _NAME_RE.fullmatch(name)
 
     @pytest.mark.fast
     def test_generate_ephemeral_name_unique(self):
         """Test that generated names are unique."""
-        names = [generate_ephemeral_name() for _ in range(100)]
+        names = {generate_ephemeral_name() for _ in range(100)}
 
         # All names should be unique
-        assert len(set(names)) == len(names)
+        assert len(names) == 100
 
 
 class TestEphemeralHelp:
@@ -59,122 +78,73 @@ class TestEphemeralHelp:
         """Test ephemeral --version output."""
         result = distrobox.run("ephemeral", ["--version"])
 
-        assert "distrobox:" in result.stdout or "distrobox:" in result.stderr
+        assert "distrobox:" in result.output
 
 
 class TestEphemeralParser:
     """Test ephemeral argument parsing."""
 
     @pytest.mark.fast
-    def test_parser_name_flag(self):
-        """Test parsing --name flag."""
-        parser = create_parser()
-        parsed, _ = parser.parse_known_args(["--name", "my-ephemeral"])
-
-        assert parsed.name == "my-ephemeral"
-
-    @pytest.mark.fast
-    def test_parser_root_flag(self):
-        """Test parsing --root flag."""
-        parser = create_parser()
-        parsed, _ = parser.parse_known_args(["--root"])
-
-        assert parsed.root is True
-
-    @pytest.mark.fast
-    def test_parser_verbose_flag(self):
-        """Test parsing --verbose flag."""
-        parser = create_parser()
-        parsed, _ = parser.parse_known_args(["--verbose"])
-
-        assert parsed.verbose is True
-
-    @pytest.mark.fast
-    def test_parser_exec_flag(self):
-        """Test parsing --exec/-e flag."""
-        parser = create_parser()
-        parsed, _ = parser.parse_known_args(["-e"])
-
-        assert parsed.exec_delimiter is True
-
-    @pytest.mark.fast
-    def test_parser_additional_flags(self):
-        """Test parsing --additional-flags."""
-        parser = create_parser()
-        # Note: value must not start with -- or it's treated as a flag
-        parsed, _ = parser.parse_known_args(["--additional-flags", "cap-add=SYS_ADMIN"])
-
-        assert "cap-add=SYS_ADMIN" in parsed.additional_flags
-
-    @pytest.mark.fast
-    def test_parser_additional_packages(self):
-        """Test parsing --additional-packages."""
-        parser = create_parser()
-        parsed, _ = parser.parse_known_args(["--additional-packages", "vim"])
-
-        assert "vim" in parsed.additional_packages
-
-    @pytest.mark.fast
-    def test_parser_init_hooks(self):
-        """Test parsing --init-hooks."""
-        parser = create_parser()
-        parsed, _ = parser.parse_known_args(["--init-hooks", "echo hello"])
-
-        assert parsed.init_hooks == "echo hello"
-
-    @pytest.mark.fast
-    def test_parser_pre_init_hooks(self):
-        """Test parsing --pre-init-hooks."""
-        parser = create_parser()
-        parsed, _ = parser.parse_known_args(["--pre-init-hooks", "echo pre"])
-
-        assert parsed.pre_init_hooks == "echo pre"
+    @pytest.mark.parametrize(
+        ("argv", "attr", "expected"),
+        [
+            (["--name", "my-ephemeral"], "name", "my-ephemeral"),
+            (["--root"], "root", True),
+            (["--verbose"], "verbose", True),
+            (["-e"], "exec_delimiter", True),
+            # Value must not start with -- or it's treated as a flag
+            (
+                ["--additional-flags", "cap-add=SYS_ADMIN"],
+                "additional_flags",
+                ["cap-add=SYS_ADMIN"],
+            ),
+            (["--additional-packages", "vim"], "additional_packages", ["vim"]),
+            (["--init-hooks", "echo hello"], "init_hooks", "echo hello"),
+            (["--pre-init-hooks", "echo pre"], "pre_init_hooks", "echo pre"),
+        ],
+        ids=[
+            "name",
+            "root",
+            "verbose",
+            "exec",
+            "additional-flags",
+            "additional-packages",
+            "init-hooks",
+            "pre-init-hooks",
+        ],
+    )
+    def test_parser_flag(self, parser, argv, attr, expected):
+        """Test that each flag is parsed into its attribute."""
+        parsed, _ = parser.parse_known_args(argv)
+
+        assert getattr(parsed, attr) == expected
 
 
 class TestEphemeralSplitArgs:
     """Test argument splitting."""
 
     @pytest.mark.fast
-    def test_split_args_with_double_dash(self):
-        """Test splitting args at --."""
-        ephemeral_args, container_cmd = _split_args(
-            ["--name", "test", "--", "echo", "hello"]
-        )
-
-        assert ephemeral_args == ["--name", "test"]
-        assert container_cmd == ["echo", "hello"]
-
-    @pytest.mark.fast
-    def test_split_args_with_e_flag(self):
-        """Test splitting args at -e."""
-        ephemeral_args, container_cmd = _split_args(["--root", "-e", "bash"])
-
-        assert ephemeral_args == ["--root"]
-        assert container_cmd == ["bash"]
-
-    @pytest.mark.fast
-    def test_split_args_with_exec_flag(self):
-        """Test splitting args at --exec."""
-        ephemeral_args, container_cmd = _split_args(["--verbose", "--exec", "zsh"])
-
-        assert ephemeral_args == ["--verbose"]
-        assert container_cmd == ["zsh"]
-
-    @pytest.mark.fast
-    def test_split_args_no_delimiter(self):
-        """Test splitting args without delimiter."""
-        ephemeral_args, container_cmd = _split_args(["--name", "test", "--root"])
-
-        assert ephemeral_args == ["--name", "test", "--root"]
-        assert container_cmd == []
-
-    @pytest.mark.fast
-    def test_split_args_empty(self):
-        """Test splitting empty args."""
-        ephemeral_args, container_cmd = _split_args([])
-
-        assert ephemeral_args == []
-        assert container_cmd == []
+    @pytest.mark.parametrize(
+        ("argv", "ephemeral", "cmd"),
+        [
+            (
+                ["--name", "test", "--", "echo", "hello"],
+                ["--name", "test"],
+                ["echo", "hello"],
+            ),
+            (["--root", "-e", "bash"], ["--root"], ["bash"]),
+            (["--verbose", "--exec", "zsh"], ["--verbose"], ["zsh"]),
+            (["--name", "test", "--root"], ["--name", "test", "--root"], []),
+            ([], [], []),
+        ],
+        ids=["double-dash", "e-flag", "exec-flag", "no-delimiter", "empty"],
+    )
+    def test_split_args(self, argv, ephemeral, cmd):
+        """Test splitting args at the first --, -e or --exec."""
+        ephemeral_args, container_cmd = _split_args(argv)
+
+        assert ephemeral_args == ephemeral
+        assert container_cmd == cmd
 
 
 class TestEphemeralOptions:
@@ -214,54 +184,36 @@ class TestEphemeralOptions:
         assert opts.init_hooks == "echo init"
         assert opts.pre_init_hooks == "echo pre"
 
-
-class TestBuildExtraFlags:
-    """Test building extra flags from config."""
-
-    @pytest.mark.fast
-    def test_build_extra_flags_empty(self):
-        """Test building extra flags with no options."""
-        config = Config()
-        config.verbose = False
-        config.rootful = False
-
-        flags = _build_extra_flags(config)
-
-        assert flags == []
-
-    @pytest.mark.fast
-    def test_build_extra_flags_verbose(self):
-        """Test building extra flags with verbose."""
-        config = Config()
-        config.verbose = True
-        config.rootful = False
-
-        flags = _build_extra_flags(config)
-
-        assert "--verbose" in flags
-
     @pytest.mark.fast
-    def test_build_extra_flags_rootful(self):
-        """Test building extra flags with rootful."""
-        config = Config()
-        config.verbose = False
-        config.rootful = True
+    def test_ephemeral_options_frozen(self):
+        """Test EphemeralOptions cannot be mutated after creation."""
+        with pytest.raises(FrozenInstanceError):
+            _BASE_OPTS.name = "other"  # type: ignore[misc]
 
-        flags = _build_extra_flags(config)
 
-        assert "--root" in flags
+class TestBuildExtraFlags:
+    """Test building extra flags from config."""
 
     @pytest.mark.fast
-    def test_build_extra_flags_both(self):
-        """Test building extra flags with both options."""
+    @pytest.mark.parametrize(
+        ("verbose", "rootful", "expected"),
+        [
+            (False, False, set()),
+            (True, False, {"--verbose"}),
+            (False, True, {"--root"}),
+            (True, True, {"--verbose", "--root"}),
+        ],
+        ids=["empty", "verbose", "rootful", "both"],
+    )
+    def test_build_extra_flags(self, verbose, rootful, expected):
+        """Test building extra flags from verbose and rootful settings."""
         config = Config()
-        config.verbose = True
-        config.rootful = True
+        config.verbose = verbose
+        config.rootful = rootful
 
         flags = _build_extra_flags(config)
 
-        assert "--verbose" in flags
-        assert "--root" in flags
+        assert set(flags) == expected
 
 
 class TestBuildCreateArgs:
@@ -270,70 +222,65 @@ class TestBuildCreateArgs:
     @pytest.mark.fast
     def test_build_create_args_basic(self):
         """Test building basic create args."""
-        opts = EphemeralOptions(name="test-ephemeral")
+        opts = replace(_BASE_OPTS, name="test-ephemeral")
         extra_flags: list[str] = []
 
         args = _build_create_args(opts, extra_flags)
 
         assert "--yes" in args
-        assert "--name" in args
-        assert "test-ephemeral" in args
+        assert _pair(args, "--name") == "test-ephemeral"
 
     @pytest.mark.fast
     def test_build_create_args_with_additional_flags(self):
         """Test building create args with additional flags."""
-        opts = EphemeralOptions(
-            name="test",
+        opts = replace(
+            _BASE_OPTS,
             additional_flags=["--cap-add=SYS_ADMIN", "--privileged"],
         )
         extra_flags: list[str] = []
 
         args = _build_create_args(opts, extra_flags)
 
-        assert "--additional-flags" in args
         # Flags should be combined
-        combined_idx = args.index("--additional-flags") + 1
-        assert "--cap-add=SYS_ADMIN" in args[combined_idx]
-        assert "--privileged" in args[combined_idx]
+        combined = _pair(args, "--additional-flags")
+        assert "--cap-add=SYS_ADMIN" in combined
+        assert "--privileged" in combined
 
     @pytest.mark.fast
     def test_build_create_args_with_additional_packages(self):
         """Test building create args with additional packages."""
-        opts = EphemeralOptions(
-            name="test",
+        opts = replace(
+            _BASE_OPTS,
             additional_packages=["vim", "git"],
         )
         extra_flags: list[str] = []
 
         args = _build_create_args(opts, extra_flags)
 
-        assert "--additional-packages" in args
+        assert _pair(args, "--additional-packages") == "vim git"
 
     @pytest.mark.fast
     def test_build_create_args_with_init_hooks(self):
         """Test building create args with init hooks."""
-        opts = EphemeralOptions(
-            name="test",
+        opts = replace(
+            _BASE_OPTS,
             init_hooks="echo hello",
         )
         extra_flags: list[str] = []
 
         args = _build_create_args(opts, extra_flags)
 
-        assert "--init-hooks" in args
-        hooks_idx = args.index("--init-hooks") + 1
-        assert args[hooks_idx] == "echo hello"
+        assert _pair(args, "--init-hooks") == "echo hello"
 
     @pytest.mark.fast
     def test_build_create_args_with_extra_flags(self):
         """Test building create args with extra flags."""
-        opts = EphemeralOptions(name="test")
+        opts = _BASE_OPTS
         extra_flags = ["--verbose", "--root"]
 
         args = _build_create_args(opts, extra_flags)
 
-        assert "--verbose" in args
-        assert "--root" in args
+        assert_contains_all(args, {"--verbose", "--root"})
 
 
 class TestBuildEnterArgs:
@@ -342,7 +289,7 @@ class TestBuildEnterArgs:
     @pytest.mark.fast
     def test_build_enter_args_basic(self):
         """Test building basic enter args."""
-        opts = EphemeralOptions(name="test-ephemeral")
+        opts = replace(_BASE_OPTS, name="test-ephemeral")
         extra_flags: list[str] = []
 
         args = _build_enter_args(opts, extra_flags)
@@ -352,22 +299,20 @@ class TestBuildEnterArgs:
     @pytest.mark.fast
     def test_build_enter_args_with_command(self):
         """Test building enter args with command."""
-        opts = EphemeralOptions(
-            name="test",
+        opts = replace(
+            _BASE_OPTS,
             container_command=["echo", "hello"],
         )
         extra_flags: list[str] = []
 
         args = _build_enter_args(opts, extra_flags)
 
-        assert "--" in args
-        assert "echo" in args
-        assert "hello" in args
+        assert_contains_all(args, {"--", "echo", "hello"})
 
     @pytest.mark.fast
     def test_build_enter_args_with_extra_flags(self):
         """Test building enter args with extra flags."""
-        opts = EphemeralOptions(name="test")
+        opts = _BASE_OPTS
         extra_flags = ["--verbose"]
 
         args = _build_enter_args(opts, extra_flags)
@@ -383,28 +328,22 @@ class TestBuildRmArgs:
         """Test building basic rm args."""
         args = _build_rm_args("test-container", [])
 
-        assert "--force" in args
-        assert "test-container" in args
-        assert "--yes" in args
+        assert_contains_all(args, {"--force", "test-container", "--yes"})
 
     @pytest.mark.fast
     def test_build_rm_args_with_extra_flags(self):
         """Test building rm args with extra flags."""
         args = _build_rm_args("test-container", ["--verbose", "--root"])
 
-        assert "--verbose" in args
-        assert "--root" in args
-        assert "--force" in args
-        assert "test-container" in args
+        assert_contains_all(args, {"--verbose", "--root", "--force", "test-container"})
 
 
 class TestBuildEphemeralOptions:
     """Test building EphemeralOptions from parsed arguments."""
 
     @pytest.mark.fast
-    def test_build_ephemeral_options_with_name(self):
+    def test_build_ephemeral_options_with_name(self, parser):
         """Test building options with provided name."""
-        parser = create_parser()
         parsed, _ = parser.parse_known_args(["--name", "my-ephemeral"])
 
         opts = _build_ephemeral_options(parsed, [], ["bash"])
@@ -413,20 +352,22 @@ class TestBuildEphemeralOptions:
         assert opts.container_command == ["bash"]
 
     @pytest.mark.fast
-    def test_build_ephemeral_options_generates_name(self):
+    def test_build_ephemeral_options_generates_name(self, parser, monkeypatch):
         """Test building options generates name when not provided."""
-        parser = create_parser()
+        # The real generator is covered by TestEphemeralNameGeneration
+        monkeypatch.setattr(
+            "distrobox_plus.commands.ephemeral.generate_ephemeral_name",
+            lambda: "distrobox-ABCDEFGHIJ",
+        )
         parsed, _ = parser.parse_known_args([])
 
         opts = _build_ephemeral_options(parsed, [], [])
 
-        assert opts.name.startswith("distrobox-")
-        assert len(opts.name) == len("distrobox-") + 10
+        assert opts.name == "distrobox-ABCDEFGHIJ"
 
     @pytest.mark.fast
-    def test_build_ephemeral_options_with_create_flags(self):
+    def test_build_ephemeral_options_with_create_flags(self, parser):
         """Test building options with create flags."""
-        parser = create_parser()
         parsed, _ = parser.parse_known_args([])
 
         opts = _build_ephemeral_options(parsed, ["--image", "alpine"], [])
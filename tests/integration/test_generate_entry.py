@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from distrobox_plus.commands.generate_entry import (
     _capitalize_first,
+    _ensure_dir,
     _generate_desktop_entry,
     _get_applications_dir,
     _get_default_icon_path,
@@ -18,93 +18,101 @@ from distrobox_plus.commands.generate_entry import (
     create_parser,
     run,
 )
+from tests.helpers.assertions import assert_contains_all
 
 pytestmark = [pytest.mark.integration, pytest.mark.generate_entry]
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Shared generate-entry parser; parse_args does not mutate it."""
+    return create_parser()
+
+
+@pytest.fixture(autouse=True)
+def _reset_created_dirs(monkeypatch):
+    """Give each test its own directory cache for _ensure_dir."""
+    monkeypatch.setattr("distrobox_plus.commands.generate_entry._created_dirs", set())
+
+
+@pytest.fixture(scope="module")
+def empty_apps_dir(tmp_path_factory):
+    """Applications directory that never contains a desktop entry."""
+    return tmp_path_factory.mktemp("apps_empty")
+
+
 class TestGenerateEntryHelp:
     """Test generate-entry help output."""
 
     @pytest.mark.fast
-    def test_generate_entry_help(self, distrobox):
-        """Test generate-entry --help output."""
+    def test_generate_entry_help_and_version(self, distrobox):
+        """Test generate-entry --help and --version output."""
         result = distrobox.run("generate-entry", ["--help"])
 
         # Help should show usage and exit 0
         assert result.returncode == 0
         assert "usage:" in result.stdout.lower() or "generate-entry" in result.stdout
 
-    @pytest.mark.fast
-    def test_generate_entry_version(self, distrobox):
-        """Test generate-entry --version output."""
         result = distrobox.run("generate-entry", ["--version"])
 
-        assert "distrobox:" in result.stdout or "distrobox:" in result.stderr
+        assert "distrobox:" in result.output
 
 
 class TestGenerateEntryParser:
     """Test generate-entry argument parsing."""
 
     @pytest.mark.fast
-    def test_parser_container_name(self):
+    def test_parser_container_name(self, parser):
         """Test parsing container name positional argument."""
-        parser = create_parser()
         args = parser.parse_args(["my-container"])
 
         assert args.container_name == "my-container"
 
     @pytest.mark.fast
-    def test_parser_default_container_name(self):
+    def test_parser_default_container_name(self, parser):
         """Test default container name."""
-        parser = create_parser()
         args = parser.parse_args([])
 
         assert args.container_name == ""
 
     @pytest.mark.fast
-    def test_parser_all_flag(self):
+    def test_parser_all_flag(self, parser):
         """Test parsing --all flag."""
-        parser = create_parser()
         args = parser.parse_args(["--all"])
 
         assert args.all_containers is True
 
     @pytest.mark.fast
-    def test_parser_delete_flag(self):
+    def test_parser_delete_flag(self, parser):
         """Test parsing --delete flag."""
-        parser = create_parser()
         args = parser.parse_args(["my-container", "--delete"])
 
         assert args.delete is True
 
     @pytest.mark.fast
-    def test_parser_icon_flag(self):
+    def test_parser_icon_flag(self, parser):
         """Test parsing --icon flag."""
-        parser = create_parser()
         args = parser.parse_args(["--icon", "/path/to/icon.png"])
 
         assert args.icon == "/path/to/icon.png"
 
     @pytest.mark.fast
-    def test_parser_icon_default(self):
+    def test_parser_icon_default(self, parser):
         """Test --icon default value."""
-        parser = create_parser()
         args = parser.parse_args([])
 
         assert args.icon == "auto"
 
     @pytest.mark.fast
-    def test_parser_root_flag(self):
+    def test_parser_root_flag(self, parser):
         """Test parsing --root flag."""
-        parser = create_parser()
         args = parser.parse_args(["--root"])
 
         assert args.root is True
 
     @pytest.mark.fast
-    def test_parser_verbose_flag(self):
+    def test_parser_verbose_flag(self, parser):
         """Test parsing --verbose flag."""
-        parser = create_parser()
         args = parser.parse_args(["--verbose"])
 
         assert args.verbose is True
@@ -114,62 +122,80 @@ class TestGenerateEntryHelpers:
     """Test generate-entry helper functions."""
 
     @pytest.mark.fast
-    def test_get_xdg_data_home(self):
-        """Test XDG data home retrieval."""
-        result = _get_xdg_data_home()
-        assert isinstance(result, Path)
-        # Should be a valid path
-        assert str(result) != ""
+    @pytest.mark.parametrize(
+        ("helper", "name", "parts"),
+        [
+            (_get_xdg_data_home, None, ()),
+            (_get_default_icon_path, "terminal-distrobox-icon.svg", ("icons",)),
+            (_get_applications_dir, "applications", ()),
+            (_get_icons_dir, None, ("icons", "distrobox")),
+        ],
+        ids=["xdg-data-home", "default-icon", "applications", "icons"],
+    )
+    def test_path_helper(self, helper, name, parts):
+        """Test that each path helper returns the expected path."""
+        result = helper()
 
-    @pytest.mark.fast
-    def test_get_default_icon_path(self):
-        """Test default icon path."""
-        result = _get_default_icon_path()
         assert isinstance(result, Path)
-        assert result.name == "terminal-distrobox-icon.svg"
-        assert "icons" in str(result)
-
-    @pytest.mark.fast
-    def test_get_applications_dir(self):
-        """Test applications directory path."""
-        result = _get_applications_dir()
-        assert isinstance(result, Path)
-        assert result.name == "applications"
-
-    @pytest.mark.fast
-    def test_get_icons_dir(self):
-        """Test icons directory path."""
-        result = _get_icons_dir()
-        assert isinstance(result, Path)
-        assert "icons" in str(result)
-        assert "distrobox" in str(result)
+        assert str(result) != ""
+        if name is not None:
+            assert result.name == name
+        assert_contains_all(result.parts, parts)
 
     @pytest.mark.fast
-    def test_capitalize_first_normal(self):
-        """Test capitalizing first letter of normal string."""
-        assert _capitalize_first("hello") == "Hello"
-        assert _capitalize_first("world") == "World"
+    def test_get_xdg_data_home_follows_env(self, monkeypatch):
+        """Test XDG data home is re-resolved when the environment changes."""
+        # Resolution never touches the filesystem, so no directory is needed
+        data_home = Path("/nonexistent/xdg-data")
+        monkeypatch.setenv("XDG_DATA_HOME", str(data_home))
+        assert _get_xdg_data_home() == data_home
 
-    @pytest.mark.fast
-    def test_capitalize_first_already_capitalized(self):
-        """Test capitalizing already capitalized string."""
-        assert _capitalize_first("Hello") == "Hello"
+        monkeypatch.setenv("XDG_DATA_HOME", str(data_home / "other"))
+        assert _get_xdg_data_home() == data_home / "other"
 
     @pytest.mark.fast
-    def test_capitalize_first_empty(self):
-        """Test capitalizing empty string."""
-        assert _capitalize_first("") == ""
+    def test_ensure_dir_recreated_by_next_run(self, monkeypatch, tmp_path):
+        """Test a directory removed after one run is created again by the next."""
+        target = tmp_path / "icons" / "distrobox"
+        _ensure_dir(target)
+        assert target.is_dir()
+
+        target.rmdir()
+        # Any run() starts a new invocation and clears the cache
+        monkeypatch.setattr(
+            "distrobox_plus.commands.generate_entry._get_applications_dir",
+            lambda: tmp_path / "applications",
+        )
+        assert run(["some-container", "--delete"]) == 0
 
-    @pytest.mark.fast
-    def test_capitalize_first_single_char(self):
-        """Test capitalizing single character."""
-        assert _capitalize_first("a") == "A"
-        assert _capitalize_first("Z") == "Z"
+        _ensure_dir(target)
+        assert target.is_dir()
 
     @pytest.mark.fast
-    def test_capitalize_first_with_hyphen(self):
-        """Test capitalizing string with hyphen."""
-        assert _capitalize_first("my-container") == "My-container"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("hello", "Hello"),
+            ("world", "World"),
+            ("Hello", "Hello"),
+            ("", ""),
+            ("a", "A"),
+            ("Z", "Z"),
+            ("my-container", "My-container"),
+        ],
+        ids=[
+            "hello",
+            "world",
+            "capitalized",
+            "empty",
+            "lower-char",
+            "upper-char",
+            "hyphen",
+        ],
+    )
+    def test_capitalize_first(self, value, expected):
+        """Test capitalizing the first letter of a string."""
+        assert _capitalize_first(value) == expected
 
     @pytest.mark.fast
     def test_get_download_command_curl(self):
@@ -180,18 +206,46 @@ class TestGenerateEntryHelpers:
             assert isinstance(result, list)
             assert result[0] in ("curl", "wget")
 
+    @pytest.mark.fast
+    def test_get_download_command_follows_path(self, monkeypatch, tmp_path):
+        """Test the download command is re-resolved when PATH changes."""
+        monkeypatch.setenv("PATH", "/nonexistent/bin")
+        assert _get_download_command() is None
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        wget = bin_dir / "wget"
+        wget.write_text("#!/bin/sh\n")
+        wget.chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+        result = _get_download_command()
+        assert result is not None
+        assert result[0] == "wget"
+
+
+@pytest.fixture(scope="module")
+def desktop_entries():
+    """Desktop entries for test-container without and with --root."""
+    base = _generate_desktop_entry(
+        container_name="test-container",
+        icon="/path/to/icon.png",
+        extra_flags="",
+    )
+    rooted = _generate_desktop_entry(
+        container_name="test-container",
+        icon="/path/to/icon.png",
+        extra_flags="--root",
+    )
+    return base, rooted
+
 
 class TestGenerateDesktopEntry:
     """Test desktop entry generation."""
 
     @pytest.mark.fast
-    def test_generate_desktop_entry_basic(self):
+    def test_generate_desktop_entry_basic(self, desktop_entries):
         """Test basic desktop entry generation."""
-        content = _generate_desktop_entry(
-            container_name="test-container",
-            icon="/path/to/icon.png",
-            extra_flags="",
-        )
+        content, _ = desktop_entries
 
         assert "[Desktop Entry]" in content
         assert "Name=Test-container" in content
@@ -200,48 +254,32 @@ class TestGenerateDesktopEntry:
         assert "Type=Application" in content
 
     @pytest.mark.fast
-    def test_generate_desktop_entry_with_root_flag(self):
+    def test_generate_desktop_entry_with_root_flag(self, desktop_entries):
         """Test desktop entry with --root flag."""
-        content = _generate_desktop_entry(
-            container_name="test-container",
-            icon="/path/to/icon.png",
-            extra_flags="--root",
-        )
+        _, content = desktop_entries
 
         assert "--root" in content
         assert "Exec=" in content
 
     @pytest.mark.fast
-    def test_generate_desktop_entry_contains_actions(self):
+    def test_generate_desktop_entry_contains_actions(self, desktop_entries):
         """Test that desktop entry contains remove action."""
-        content = _generate_desktop_entry(
-            container_name="test-container",
-            icon="/path/to/icon.png",
-            extra_flags="",
-        )
+        content, _ = desktop_entries
 
         assert "[Desktop Action Remove]" in content
         assert "Name=Remove Test-container from system" in content
 
     @pytest.mark.fast
-    def test_generate_desktop_entry_categories(self):
+    def test_generate_desktop_entry_categories(self, desktop_entries):
         """Test desktop entry categories."""
-        content = _generate_desktop_entry(
-            container_name="test-container",
-            icon="/path/to/icon.png",
-            extra_flags="",
-        )
+        content, _ = desktop_entries
 
         assert "Categories=Distrobox;System;Utility" in content
 
     @pytest.mark.fast
-    def test_generate_desktop_entry_keywords(self):
+    def test_generate_desktop_entry_keywords(self, desktop_entries):
         """Test desktop entry keywords."""
-        content = _generate_desktop_entry(
-            container_name="test-container",
-            icon="/path/to/icon.png",
-            extra_flags="",
-        )
+        content, _ = desktop_entries
 
         assert "Keywords=distrobox;" in content
 
@@ -258,13 +296,12 @@ class TestGenerateEntryRun:
         assert result == 1
 
     @pytest.mark.fast
-    def test_run_delete_nonexistent_entry(self, monkeypatch):
+    def test_run_delete_nonexistent_entry(self, monkeypatch, empty_apps_dir):
         """Test deleting non-existent entry (should succeed)."""
-        import distrobox_plus.commands.generate_entry as ge_mod
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Mock the applications directory
-            monkeypatch.setattr(ge_mod, "_get_applications_dir", lambda: Path(tmpdir))
-            # Delete should succeed even if entry doesn't exist
-            result = run(["nonexistent-container", "--delete"])
-            assert result == 0
+        monkeypatch.setattr(
+            "distrobox_plus.commands.generate_entry._get_applications_dir",
+            lambda: empty_apps_dir,
+        )
+        # Delete should succeed even if entry doesn't exist
+        result = run(["nonexistent-container", "--delete"])
+        assert result == 0
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from tests.conftest import unique_container_name
 from tests.helpers.assertions import (
     assert_command_success,
     assert_container_in_list,
@@ -12,6 +13,30 @@ from tests.helpers.assertions import (
 pytestmark = [pytest.mark.integration, pytest.mark.list]
 
 
+@pytest.fixture(scope="class")
+def listed_container(distrobox, keep_containers):
+    """Create one uninitialized container shared by a class of list tests."""
+    name = unique_container_name()
+    result = distrobox.create(name)
+    assert result.success, f"Failed to create container: {result.stderr}"
+    yield name
+
+    if keep_containers:
+        print(f"\nKeeping container for debugging: {name}")
+        return
+
+    try:
+        distrobox.force_remove_container(name)
+    except Exception as e:
+        print(f"Warning: Failed to clean up container {name}: {e}")
+
+
+@pytest.fixture(scope="class")
+def list_result(distrobox, listed_container):
+    """List containers once after listed_container exists."""
+    return distrobox.list()
+
+
 class TestListBasic:
     """Basic list command tests."""
 
@@ -27,31 +52,25 @@ class TestListBasic:
         assert_command_success(result)
 
     @pytest.mark.fast
-    def test_list_shows_created_container(self, distrobox, created_container):
+    def test_list_shows_created_container(self, list_result, listed_container):
         """Test that a created container appears in the list."""
-        result = distrobox.list()
-
-        assert_command_success(result)
-        assert_container_in_list(result, created_container)
+        assert_command_success(list_result)
+        assert_container_in_list(list_result, listed_container)
 
     @pytest.mark.fast
-    def test_list_shows_image_name(self, distrobox, created_container):
+    def test_list_shows_image_name(self, list_result):
         """Test that the image name is shown in the list."""
-        result = distrobox.list()
-
-        assert_command_success(result)
+        assert_command_success(list_result)
         # Alpine should appear since we use it as default test image
-        assert "alpine" in result.stdout.lower()
+        assert "alpine" in list_result.stdout.lower()
 
     @pytest.mark.fast
-    def test_list_shows_status(self, distrobox, created_container):
+    def test_list_shows_status(self, list_result):
         """Test that container status is shown in the list."""
-        result = distrobox.list()
-
-        assert_command_success(result)
+        assert_command_success(list_result)
         # Status could be "created", "running", "exited", etc.
         # Just verify we get some output
-        assert result.stdout.strip() != ""
+        assert list_result.stdout.strip() != ""
 
 
 class TestListFiltering:
@@ -78,19 +97,9 @@ class TestListMultiple:
     """Multiple container list tests."""
 
     @pytest.mark.fast
-    def test_list_multiple_containers(
-        self, distrobox, test_container_name, container_cleanup
-    ):
+    def test_list_multiple_containers(self, distrobox, two_containers):
         """Test listing multiple distrobox containers."""
-        name1 = f"{test_container_name}-1"
-        name2 = f"{test_container_name}-2"
-        container_cleanup.extend([name1, name2])
-
-        # Create two containers
-        result1 = distrobox.create(name1)
-        assert_command_success(result1)
-        result2 = distrobox.create(name2)
-        assert_command_success(result2)
+        name1, name2 = two_containers
 
         # List should show both
         list_result = distrobox.list()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from tests.conftest import DistroboxImplementation
 from tests.helpers.assertions import (
     assert_command_failed,
     assert_command_success,
@@ -60,18 +61,13 @@ class TestStopNonexistent:
 class TestStopAll:
     """Stop all containers tests."""
 
+    @pytest.mark.all_containers
     @pytest.mark.slow  # distrobox.enter() triggers container initialization
-    def test_stop_all_containers(
-        self, distrobox, test_container_name, container_cleanup
-    ):
+    def test_stop_all_containers(self, distrobox, two_containers):
         """Test stopping all distrobox containers."""
-        name1 = f"{test_container_name}-1"
-        name2 = f"{test_container_name}-2"
-        container_cleanup.extend([name1, name2])
+        name1, name2 = two_containers
 
-        # Create and start two containers
-        distrobox.create(name1)
-        distrobox.create(name2)
+        # Start both containers
         distrobox.enter(name1, command="true")  # Start container (triggers init)
         distrobox.enter(name2, command="true")  # Start container (triggers init)
 
@@ -82,3 +78,14 @@ class TestStopAll:
         # Both containers should be stopped
         assert_container_stopped(distrobox, name1)
         assert_container_stopped(distrobox, name2)
+
+    @pytest.mark.fast
+    def test_stop_all_refused_on_xdist_worker(self, monkeypatch):
+        """Test that an unmarked --all call fails instead of reaching other workers."""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+        distrobox = DistroboxImplementation(
+            name="python", container_manager="podman", container_host=None
+        )
+
+        with pytest.raises(pytest.fail.Exception, match="all_containers"):
+            distrobox.stop(all=True)
@@ -13,34 +13,35 @@ from distrobox_plus.config import Config
 pytestmark = [pytest.mark.integration, pytest.mark.upgrade]
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Shared upgrade parser; parse_args does not mutate it."""
+    return create_parser()
+
+
 class TestUpgradeHelp:
     """Test upgrade help output."""
 
     @pytest.mark.fast
-    def test_upgrade_help(self, distrobox):
-        """Test upgrade --help output."""
+    def test_upgrade_help_and_version(self, distrobox):
+        """Test upgrade --help and --version output."""
         result = distrobox.run("upgrade", ["--help"])
 
         # Help should show usage and exit 0
         assert result.returncode == 0
         assert "usage:" in result.stdout.lower() or "upgrade" in result.stdout
 
-    @pytest.mark.fast
-    def test_upgrade_version(self, distrobox):
-        """Test upgrade --version output."""
         result = distrobox.run("upgrade", ["--version"])
 
-        assert "distrobox:" in result.stdout or "distrobox:" in result.stderr
+        assert "distrobox:" in result.output
 
 
 class TestUpgradeParser:
     """Test upgrade argument parsing."""
 
     @pytest.mark.fast
-    def test_parser_all_flag(self):
+    def test_parser_all_flag(self, parser):
         """Test parsing -a/--all flag."""
-        parser = create_parser()
-
         parsed = parser.parse_args(["--all"])
         assert parsed.all is True
 
@@ -48,18 +49,15 @@ class TestUpgradeParser:
         assert parsed.all is True
 
     @pytest.mark.fast
-    def test_parser_running_flag(self):
+    def test_parser_running_flag(self, parser):
         """Test parsing --running flag."""
-        parser = create_parser()
         parsed = parser.parse_args(["--running", "--all"])
 
         assert parsed.running is True
 
     @pytest.mark.fast
-    def test_parser_root_flag(self):
+    def test_parser_root_flag(self, parser):
         """Test parsing -r/--root flag."""
-        parser = create_parser()
-
         parsed = parser.parse_args(["--root", "--all"])
         assert parsed.root is True
 
@@ -67,10 +65,8 @@ class TestUpgradeParser:
         assert parsed.root is True
 
     @pytest.mark.fast
-    def test_parser_verbose_flag(self):
+    def test_parser_verbose_flag(self, parser):
         """Test parsing -v/--verbose flag."""
-        parser = create_parser()
-
         parsed = parser.parse_args(["--verbose", "--all"])
         assert parsed.verbose is True
 
@@ -78,9 +74,8 @@ class TestUpgradeParser:
         assert parsed.verbose is True
 
     @pytest.mark.fast
-    def test_parser_containers_positional(self):
+    def test_parser_containers_positional(self, parser):
         """Test parsing positional container names."""
-        parser = create_parser()
         parsed = parser.parse_args(["container1", "container2"])
 
         assert parsed.containers == ["container1", "container2"]
@@ -90,49 +85,25 @@ class TestBuildExtraFlags:
     """Test building extra flags from config."""
 
     @pytest.mark.fast
-    def test_build_extra_flags_empty(self):
-        """Test building extra flags with no options."""
-        config = Config()
-        config.verbose = False
-        config.rootful = False
-
-        flags = _build_extra_flags(config)
-
-        assert flags == []
-
-    @pytest.mark.fast
-    def test_build_extra_flags_verbose(self):
-        """Test building extra flags with verbose."""
-        config = Config()
-        config.verbose = True
-        config.rootful = False
-
-        flags = _build_extra_flags(config)
-
-        assert "--verbose" in flags
-
-    @pytest.mark.fast
-    def test_build_extra_flags_rootful(self):
-        """Test building extra flags with rootful."""
-        config = Config()
-        config.verbose = False
-        config.rootful = True
-
-        flags = _build_extra_flags(config)
-
-        assert "--root" in flags
-
-    @pytest.mark.fast
-    def test_build_extra_flags_both(self):
-        """Test building extra flags with both options."""
+    @pytest.mark.parametrize(
+        ("verbose", "rootful", "expected"),
+        [
+            (False, False, set()),
+            (True, False, {"--verbose"}),
+            (False, True, {"--root"}),
+            (True, True, {"--verbose", "--root"}),
+        ],
+        ids=["empty", "verbose", "rootful", "both"],
+    )
+    def test_build_extra_flags(self, verbose, rootful, expected):
+        """Test building extra flags from verbose and rootful settings."""
         config = Config()
-        config.verbose = True
-        config.rootful = True
+        config.verbose = verbose
+        config.rootful = rootful
 
         flags = _build_extra_flags(config)
 
-        assert "--verbose" in flags
-        assert "--root" in flags
+        assert set(flags) == expected
 
 
 class TestUpgradeNoArgs:
@@ -144,9 +115,10 @@ class TestUpgradeNoArgs:
         result = distrobox.run("upgrade", [])
 
         # Should show help (contains usage info)
+        stdout_lower = result.stdout.lower()
         assert (
-            "usage:" in result.stdout.lower()
-            or "upgrade" in result.stdout.lower()
+            "usage:" in stdout_lower
+            or "upgrade" in stdout_lower
             or "upgrade" in result.stderr.lower()
         )
         # Should exit 0
@@ -156,6 +128,7 @@ class TestUpgradeNoArgs:
 class TestUpgradeAllEmpty:
     """Test upgrade --all with no containers."""
 
+    @pytest.mark.all_containers
     @pytest.mark.fast
     def test_upgrade_all_no_containers(self, distrobox):
         """Test --all with no containers exits 0."""
@@ -4,19 +4,33 @@ from __future__ import annotations
 
 import pytest
 
+from tests.conftest import DEFAULT_TEST_IMAGE
 from tests.helpers.assertions import (
     assert_command_success,
     assert_container_exists,
-    assert_container_in_list,
     assert_container_not_exists,
-    assert_container_not_in_list,
     assert_container_running,
+    assert_container_state,
     assert_container_stopped,
+    assert_success_contains,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.slow]
 
 
+@pytest.fixture
+def workflow_image(distrobox, request):
+    """Image for workflows that are not about initialization.
+
+    The boosted template image is built by the python implementation, so
+    only python uses it; the original keeps exercising its own init on the
+    stock image.
+    """
+    if distrobox.name == "python":
+        return request.getfixturevalue("template_image")
+    return DEFAULT_TEST_IMAGE
+
+
 class TestFullLifecycle:
     """Complete container lifecycle tests."""
 
@@ -24,61 +38,44 @@ class TestFullLifecycle:
         """Test complete container lifecycle: create -> enter -> stop -> rm."""
         name = test_container_name
 
-        # 1. Create container
+        # 1. Create container and verify it appears in list
         create_result = distrobox.create(name)
         assert_command_success(create_result)
-        assert_container_exists(distrobox, name)
-
-        # 2. Verify it appears in list
-        list_result = distrobox.list()
-        assert_command_success(list_result)
-        assert_container_in_list(list_result, name)
+        assert_container_state(distrobox, name, exists=True)
 
-        # 3. Enter container and run command
+        # 2. Enter container and run command
         enter_result = distrobox.enter(name, command="echo 'lifecycle test'")
-        assert_command_success(enter_result)
-        assert "lifecycle test" in enter_result.stdout
+        assert_success_contains(enter_result, "lifecycle test")
 
-        # 4. Verify container is running after entering
+        # 3. Verify container is running after entering
         assert_container_running(distrobox, name)
 
-        # 5. Stop container
-        stop_result = distrobox.stop(name)
+        # 4. Stop container and verify it is still listed but stopped
+        stop_result = distrobox.stop(name, capture=False)
         assert_command_success(stop_result)
-        assert_container_stopped(distrobox, name)
+        assert_container_state(distrobox, name, exists=True, running=False)
 
-        # 6. Verify still in list but stopped
-        list_result2 = distrobox.list()
-        assert_command_success(list_result2)
-        assert_container_in_list(list_result2, name)
-
-        # 7. Remove container
-        rm_result = distrobox.rm(name)
+        # 5. Remove container and verify it is no longer listed
+        rm_result = distrobox.rm(name, capture=False)
         assert_command_success(rm_result)
-        assert_container_not_exists(distrobox, name)
-
-        # 8. Verify no longer in list
-        list_result3 = distrobox.list()
-        assert_command_success(list_result3)
-        assert_container_not_in_list(list_result3, name)
+        assert_container_state(distrobox, name, exists=False)
 
-    def test_multiple_entries(self, distrobox, test_container_name, container_cleanup):
+    def test_multiple_entries(
+        self, distrobox, test_container_name, container_cleanup, workflow_image
+    ):
         """Test multiple entries into the same container."""
         name = test_container_name
-        container_cleanup.append(name)
+        container_cleanup.add(name)
 
         # Create container
-        distrobox.create(name, check=True)
+        distrobox.create(name, image=workflow_image, check=True)
 
-        # Enter multiple times and verify state is preserved
+        # Enter twice and verify state from the first entry is preserved
         distrobox.enter(name, command="touch /tmp/test-file-1", check=True)
-        distrobox.enter(name, command="touch /tmp/test-file-2", check=True)
-
-        # Verify both files exist
-        result = distrobox.enter(name, command="ls /tmp/test-file-1 /tmp/test-file-2")
-        assert_command_success(result)
-        assert "test-file-1" in result.stdout
-        assert "test-file-2" in result.stdout
+        result = distrobox.enter_batch(
+            name, ["touch /tmp/test-file-2", "ls /tmp/test-file-1 /tmp/test-file-2"]
+        )
+        assert_success_contains(result, "test-file-1", "test-file-2")
 
 
 class TestMultiDistroWorkflow:
@@ -114,60 +111,60 @@ class TestMultiDistroWorkflow:
 
         finally:
             # Clean up
-            distrobox.stop(name)
-            distrobox.rm(name, force=True)
+            distrobox.stop(name, capture=False)
+            distrobox.rm(name, force=True, capture=False)
 
 
 class TestRecreateWorkflow:
     """Container recreation workflow tests."""
 
     def test_recreate_after_removal(
-        self, distrobox, test_container_name, container_cleanup
+        self, distrobox, test_container_name, container_cleanup, workflow_image
     ):
         """Test that a container can be recreated after removal."""
         name = test_container_name
-        container_cleanup.append(name)
+        container_cleanup.add(name)
 
         # Create first time
-        distrobox.create(name, check=True)
+        distrobox.create(name, image=workflow_image, check=True)
         distrobox.enter(name, command="echo first", check=True)
 
         # Remove
-        distrobox.stop(name)
-        distrobox.rm(name, force=True, check=True)
-        container_cleanup.remove(name)
+        distrobox.stop(name, capture=False)
+        distrobox.rm(name, force=True, check=True, capture=False)
+        container_cleanup.discard(name)
         assert_container_not_exists(distrobox, name)
 
         # Recreate
-        container_cleanup.append(name)
-        distrobox.create(name, check=True)
+        container_cleanup.add(name)
+        distrobox.create(name, image=workflow_image, check=True)
         assert_container_exists(distrobox, name)
 
         # Enter again
         result = distrobox.enter(name, command="echo second")
-        assert_command_success(result)
-        assert "second" in result.stdout
+        assert_success_contains(result, "second")
 
 
 class TestStopAndRestart:
     """Stop and restart workflow tests."""
 
-    def test_stop_and_restart(self, distrobox, test_container_name, container_cleanup):
+    def test_stop_and_restart(
+        self, distrobox, test_container_name, container_cleanup, workflow_image
+    ):
         """Test stopping and restarting a container."""
         name = test_container_name
-        container_cleanup.append(name)
+        container_cleanup.add(name)
 
         # Create and start
-        distrobox.create(name, check=True)
+        distrobox.create(name, image=workflow_image, check=True)
         distrobox.enter(name, command="echo started", check=True)
         assert_container_running(distrobox, name)
 
         # Stop
-        distrobox.stop(name, check=True)
+        distrobox.stop(name, check=True, capture=False)
         assert_container_stopped(distrobox, name)
 
         # Start again by entering
         result = distrobox.enter(name, command="echo restarted")
-        assert_command_success(result)
-        assert "restarted" in result.stdout
+        assert_success_contains(result, "restarted")
         assert_container_running(distrobox, name)
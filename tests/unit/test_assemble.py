@@ -0,0 +1,527 @@
+"""Unit tests for distrobox_plus.commands.assemble module."""
+
+from __future__ import annotations
+
+import base64
+
+import pytest
+
+from distrobox_plus.commands.assemble import (
+    ContainerSpec,
+    ManifestParser,
+    _build_create_args,
+    _decode_hooks,
+    _encode_variable,
+    _sanitize_variable,
+    _strip_quotes,
+    create_parser,
+)
+
+pytestmark = [pytest.mark.fast, pytest.mark.assemble]
+
+# Actions accepted by the assemble parser
+_ACTIONS = frozenset({"create", "rm"})
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Shared assemble parser; parse_args does not mutate it."""
+    return create_parser()
+
+
+class TestAssembleParser:
+    """Test assemble argument parsing."""
+
+    # Sorted so collection order is stable across processes
+    @pytest.mark.parametrize("action", sorted(_ACTIONS))
+    def test_parser_action(self, parser, action):
+        """Test parsing each supported action."""
+        parsed = parser.parse_args([action])
+
+        assert parsed.action == action
+
+    def test_parser_file_option(self, parser):
+        """Test parsing --file option."""
+        parsed = parser.parse_args(["create", "--file", "/path/to/file.ini"])
+
+        assert parsed.file == "/path/to/file.ini"
+
+    def test_parser_name_option(self, parser):
+        """Test parsing -n/--name option."""
+        parsed = parser.parse_args(["create", "--name", "my-box"])
+        assert parsed.name == "my-box"
+
+        parsed = parser.parse_args(["create", "-n", "my-box"])
+        assert parsed.name == "my-box"
+
+    def test_parser_replace_flag(self, parser):
+        """Test parsing -R/--replace flag."""
+        parsed = parser.parse_args(["create", "--replace"])
+        assert parsed.replace is True
+
+        parsed = parser.parse_args(["create", "-R"])
+        assert parsed.replace is True
+
+    def test_parser_dry_run_flag(self, parser):
+        """Test parsing -d/--dry-run flag."""
+        parsed = parser.parse_args(["create", "--dry-run"])
+        assert parsed.dry_run is True
+
+        parsed = parser.parse_args(["create", "-d"])
+        assert parsed.dry_run is True
+
+    def test_parser_verbose_flag(self, parser):
+        """Test parsing -v/--verbose flag."""
+        parsed = parser.parse_args(["create", "--verbose"])
+        assert parsed.verbose is True
+
+        parsed = parser.parse_args(["create", "-v"])
+        assert parsed.verbose is True
+
+
+class TestManifestParser:
+    """Test manifest parsing."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param(
+                """\
+[my-box]
+image=alpine:latest
+init=false
+""",
+                {"my-box": {"name": "my-box", "image": "alpine:latest", "init": False}},
+                id="simple_section",
+            ),
+            pytest.param(
+                """\
+[box1]
+image=alpine
+init=true
+nvidia=false
+""",
+                {"box1": {"init": True, "nvidia": False}},
+                id="boolean_normalization",
+            ),
+            pytest.param(
+                """\
+[box1]
+image=alpine
+volume=/home:/home
+volume=/tmp:/tmp
+additional_packages=git
+additional_packages=vim
+""",
+                {
+                    "box1": {
+                        "volumes": ["/home:/home", "/tmp:/tmp"],
+                        "additional_packages": ["git", "vim"],
+                    }
+                },
+                id="multi_value_keys",
+            ),
+            pytest.param(
+                """\
+# This is a header comment
+[my-box]  # inline comment
+image=alpine:latest  # trailing comment
+# init=true
+""",
+                # init keeps its default, not the value from the commented line
+                {"my-box": {"image": "alpine:latest", "init": False}},
+                id="comments",
+            ),
+            pytest.param(
+                """\
+[box1]
+image=alpine:latest
+
+[box2]
+image=fedora:latest
+""",
+                {
+                    "box1": {"image": "alpine:latest"},
+                    "box2": {"image": "fedora:latest"},
+                },
+                id="multiple_sections",
+            ),
+        ],
+    )
+    def test_parse(self, content, expected):
+        """Test that parsed specs carry the expected field values."""
+        specs = ManifestParser(content).parse()
+
+        assert specs.keys() == expected.keys()
+        for name, fields in expected.items():
+            for attr, value in fields.items():
+                assert getattr(specs[name], attr) == value, f"{name}.{attr}"
+
+
+class TestIncludeResolution:
+    """Test include directive resolution."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param(
+                """\
+[base]
+image=alpine:latest
+init=true
+
+[derived]
+include=base
+nvidia=true
+""",
+                {"image": "alpine:latest", "init": True, "nvidia": True},
+                id="simple_include",
+            ),
+            pytest.param(
+                """\
+[base]
+image=alpine:latest
+
+[derived]
+include=base
+image=fedora:latest
+""",
+                {"image": "fedora:latest"},
+                id="include_override",
+            ),
+            pytest.param(
+                """\
+[base]
+image=alpine
+volume=/base:/base
+
+[derived]
+include=base
+volume=/derived:/derived
+""",
+                {"volumes": ["/base:/base", "/derived:/derived"]},
+                id="include_accumulation",
+            ),
+            pytest.param(
+                # Shell uses: tr -d '"' which removes ALL double quotes.
+                """\
+[base]
+image=alpine:latest
+
+[derived]
+include="base"
+""",
+                {"image": "alpine:latest"},
+                id="include_with_quoted_name",
+            ),
+        ],
+    )
+    def test_include(self, content, expected):
+        """Test that [derived] resolves its include chain as expected."""
+        derived = ManifestParser(content).parse()["derived"]
+
+        for attr, value in expected.items():
+            assert getattr(derived, attr) == value, attr
+
+    @pytest.mark.parametrize(
+        ("content", "fragments"),
+        [
+            pytest.param(
+                """\
+[box1]
+include=box2
+
+[box2]
+include=box1
+""",
+                ["circular reference"],
+                id="circular_include",
+            ),
+            pytest.param(
+                """\
+[box1]
+include=nonexistent
+""",
+                ["cannot include", "nonexistent"],
+                id="missing_include",
+            ),
+            pytest.param(
+                # Shell's include_stack is accumulated per section, so if A
+                # includes B and C, and C also includes B, the second B is
+                # detected as a duplicate/circular reference.
+                """\
+[base]
+image=alpine:latest
+
+[dev]
+include=base
+nvidia=true
+
+[prod]
+include=base
+include=dev
+""",
+                ["circular reference", "base"],
+                id="diamond_inheritance",
+            ),
+        ],
+    )
+    def test_include_errors(self, content, fragments):
+        """Test that broken include chains are rejected (shell compatibility)."""
+        parser = ManifestParser(content)
+
+        with pytest.raises(ValueError) as exc_info:
+            parser.parse()
+
+        message = str(exc_info.value).lower()
+        for fragment in fragments:
+            assert fragment in message
+
+
+class TestEdgeCases:
+    """Test edge cases for shell script compatibility."""
+
+    def test_section_name_with_spaces(self):
+        """Test that spaces in section names are removed (shell compatibility).
+
+        Shell uses: tr -d '][ ' which removes ALL brackets and spaces.
+        """
+        content = """\
+[ my box ]
+image=alpine:latest
+"""
+        parser = ManifestParser(content)
+        specs = parser.parse()
+
+        # Shell removes ALL spaces, so "[ my box ]" becomes "mybox"
+        assert "mybox" in specs
+        assert specs["mybox"].image == "alpine:latest"
+
+    def test_key_with_spaces(self):
+        """Test that spaces in keys are removed (shell compatibility).
+
+        Shell uses: tr -d ' ' which removes ALL spaces from key.
+        """
+        content = """\
+[mybox]
+im age=alpine:latest
+"""
+        parser = ManifestParser(content)
+        specs = parser.parse()
+
+        # Shell removes ALL spaces from key, so "im age" becomes "image"
+        assert specs["mybox"].image == "alpine:latest"
+
+    def test_key_with_leading_trailing_spaces(self):
+        """Test keys with leading/trailing spaces."""
+        content = """\
+[mybox]
+  image  =alpine:latest
+"""
+        parser = ManifestParser(content)
+        specs = parser.parse()
+
+        assert specs["mybox"].image == "alpine:latest"
+
+
+class TestEncodeVariable:
+    """Test _encode_variable function."""
+
+    def test_encode_simple_string(self):
+        """Test encoding a simple string."""
+        result = _encode_variable("echo hello")
+        decoded = base64.b64decode(result).decode()
+        assert decoded == "echo hello"
+
+    def test_encode_strips_double_quotes(self):
+        """Test that surrounding double quotes are stripped."""
+        result = _encode_variable('"echo hello"')
+        decoded = base64.b64decode(result).decode()
+        assert decoded == "echo hello"
+
+    def test_encode_strips_single_quotes(self):
+        """Test that surrounding single quotes are stripped."""
+        result = _encode_variable("'echo hello'")
+        decoded = base64.b64decode(result).decode()
+        assert decoded == "echo hello"
+
+
+class TestSanitizeVariable:
+    """Test _sanitize_variable function."""
+
+    def test_sanitize_no_spaces(self):
+        """Test that values without spaces are unchanged."""
+        result = _sanitize_variable("value")
+        assert result == "value"
+
+    def test_sanitize_with_spaces_adds_quotes(self):
+        """Test that spaces cause quotes to be added."""
+        result = _sanitize_variable("value with spaces")
+        assert result == '"value with spaces"'
+
+    def test_sanitize_with_double_quotes_uses_single(self):
+        """Test that double quotes cause single quotes to be used."""
+        result = _sanitize_variable('value with "quotes"')
+        assert result == "'value with \"quotes\"'"
+
+    def test_sanitize_already_quoted(self):
+        """Test that already quoted values are unchanged."""
+        result = _sanitize_variable('"already quoted"')
+        assert result == '"already quoted"'
+
+
+class TestStripQuotes:
+    """Test _strip_quotes function (shell quote parsing compatibility)."""
+
+    def test_strip_double_quotes(self):
+        """Test stripping matching double quotes."""
+        assert _strip_quotes('"hello"') == "hello"
+
+    def test_strip_single_quotes(self):
+        """Test stripping matching single quotes."""
+        assert _strip_quotes("'hello'") == "hello"
+
+    def test_unmatched_start_double_quote(self):
+        """Test that unmatched starting double quote is preserved."""
+        assert _strip_quotes('"hello') == '"hello'
+
+    def test_unmatched_end_single_quote(self):
+        """Test that unmatched ending single quote is preserved."""
+        assert _strip_quotes("hello'") == "hello'"
+
+    def test_no_quotes(self):
+        """Test that values without quotes are unchanged."""
+        assert _strip_quotes("hello") == "hello"
+
+    def test_empty_quotes(self):
+        """Test stripping empty quoted string."""
+        assert _strip_quotes('""') == ""
+        assert _strip_quotes("''") == ""
+
+    def test_mismatched_quotes(self):
+        """Test that mismatched quote types are preserved."""
+        assert _strip_quotes("'hello\"") == "'hello\""
+        assert _strip_quotes("\"hello'") == "\"hello'"
+
+    def test_single_quote_char(self):
+        """Test single quote character is preserved."""
+        assert _strip_quotes('"') == '"'
+        assert _strip_quotes("'") == "'"
+
+
+class TestDecodeHooks:
+    """Test _decode_hooks function."""
+
+    def test_decode_empty_list(self):
+        """Test decoding empty list returns empty string."""
+        result = _decode_hooks([])
+        assert result == ""
+
+    def test_decode_single_hook(self):
+        """Test decoding a single hook."""
+        encoded = base64.b64encode(b"echo hello").decode()
+        result = _decode_hooks([encoded])
+
+        assert "echo hello" in result
+        assert result.startswith(": ;")
+
+    def test_decode_multiple_hooks_with_separator(self):
+        """Test that multiple hooks are joined with &&."""
+        hook1 = base64.b64encode(b"echo hello").decode()
+        hook2 = base64.b64encode(b"echo world").decode()
+        result = _decode_hooks([hook1, hook2])
+
+        assert "echo hello" in result
+        assert "echo world" in result
+        assert "&&" in result
+
+    def test_decode_hook_ending_with_semicolon(self):
+        """Test that hooks ending with ; don't add &&."""
+        hook1 = base64.b64encode(b"echo hello;").decode()
+        hook2 = base64.b64encode(b"echo world").decode()
+        result = _decode_hooks([hook1, hook2])
+
+        # Should not have && after the semicolon
+        # The result should be something like ": ; echo hello;  echo world"
+        assert "echo hello;" in result
+        assert "echo world" in result
+
+
+class TestBuildCreateArgs:
+    """Test _build_create_args function."""
+
+    def test_build_basic_args(self):
+        """Test building basic create arguments."""
+        spec = ContainerSpec(
+            name="test-box",
+            image="alpine:latest",
+        )
+        args = _build_create_args(spec, verbose=False)
+
+        assert "--yes" in args
+        assert "--name" in args
+        assert "test-box" in args
+        assert "--image" in args
+        assert "alpine:latest" in args
+
+    def test_build_with_verbose(self):
+        """Test building args with verbose flag."""
+        spec = ContainerSpec(name="test", image="alpine")
+        args = _build_create_args(spec, verbose=True)
+
+        assert "-v" in args
+
+    def test_build_with_init(self):
+        """Test building args with init flag."""
+        spec = ContainerSpec(name="test", image="alpine", init=True)
+        args = _build_create_args(spec, verbose=False)
+
+        assert "--init" in args
+
+    def test_build_with_no_entry(self):
+        """Test building args with entry=false (--no-entry)."""
+        spec = ContainerSpec(name="test", image="alpine", entry=False)
+        args = _build_create_args(spec, verbose=False)
+
+        assert "--no-entry" in args
+
+    def test_build_with_unshare_flags(self):
+        """Test building args with unshare flags."""
+        spec = ContainerSpec(
+            name="test",
+            image="alpine",
+            unshare_netns=True,
+            unshare_ipc=True,
+        )
+        args = _build_create_args(spec, verbose=False)
+
+        assert "--unshare-netns" in args
+        assert "--unshare-ipc" in args
+
+    def test_build_with_volumes(self):
+        """Test building args with volumes."""
+        spec = ContainerSpec(
+            name="test",
+            image="alpine",
+            volumes=["/home:/home", "/tmp:/tmp"],
+        )
+        args = _build_create_args(spec, verbose=False)
+
+        # Each volume should have its own --volume flag
+        assert args.count("--volume") == 2
+        assert "/home:/home" in args
+        assert "/tmp:/tmp" in args
+
+    def test_build_with_additional_packages(self):
+        """Test building args with additional packages."""
+        spec = ContainerSpec(
+            name="test",
+            image="alpine",
+            additional_packages=["git", "vim", "curl"],
+        )
+        args = _build_create_args(spec, verbose=False)
+
+        # Packages should be joined into a single string
+        assert "--additional-packages" in args
+        idx = args.index("--additional-packages")
+        assert "git vim curl" == args[idx + 1]
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import itertools
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
 from distrobox_plus.utils.builder import (
+    build_image,
     generate_containerfile,
     get_boost_image_name,
     get_boost_image_tag,
 )
 
+# Section header and argument text for each optional Containerfile section,
+# in (additional_packages, init_hooks, pre_init_hooks) order
+_OPTIONAL_SECTIONS = (
+    ("# Install additional packages", "git vim"),
+    ("# Init hooks", "touch /tmp/test"),
+    ("# Pre-init hooks", "echo hello"),
+)
+
 
 class TestGetBoostImageName:
     """Tests for get_boost_image_name function."""
@@ -102,38 +117,25 @@ class TestGenerateContainerfile:
         result = generate_containerfile("alpine:latest")
         assert "# Install distrobox dependencies" in result
 
-    def test_no_additional_packages_without_arg(self):
-        """Test that additional packages section is absent without arg."""
-        result = generate_containerfile("alpine:latest")
-        assert "# Install additional packages" not in result
-
-    def test_has_additional_packages_with_arg(self):
-        """Test that additional packages section is present with arg."""
-        result = generate_containerfile("alpine:latest", additional_packages="git vim")
-        assert "# Install additional packages" in result
-        assert "git vim" in result
-
-    def test_no_init_hooks_without_arg(self):
-        """Test that init hooks section is absent without arg."""
-        result = generate_containerfile("alpine:latest")
-        assert "# Init hooks" not in result
-
-    def test_has_init_hooks_with_arg(self):
-        """Test that init hooks section is present with arg."""
-        result = generate_containerfile("alpine:latest", init_hooks="touch /tmp/test")
-        assert "# Init hooks" in result
-        assert "touch /tmp/test" in result
-
-    def test_no_pre_init_hooks_without_arg(self):
-        """Test that pre-init hooks section is absent without arg."""
-        result = generate_containerfile("alpine:latest")
-        assert "# Pre-init hooks" not in result
+    @pytest.mark.parametrize(
+        ("packages", "init_hooks", "pre_init_hooks"),
+        list(itertools.product((False, True), repeat=3)),
+        ids=lambda flag: "on" if flag else "off",
+    )
+    def test_optional_sections(self, packages, init_hooks, pre_init_hooks):
+        """Test that each optional section is present only with its arg."""
+        result = generate_containerfile(
+            "alpine:latest",
+            additional_packages="git vim" if packages else "",
+            init_hooks="touch /tmp/test" if init_hooks else "",
+            pre_init_hooks="echo hello" if pre_init_hooks else "",
+        )
 
-    def test_has_pre_init_hooks_with_arg(self):
-        """Test that pre-init hooks section is present with arg."""
-        result = generate_containerfile("alpine:latest", pre_init_hooks="echo hello")
-        assert "# Pre-init hooks" in result
-        assert "echo hello" in result
+        for enabled, markers in zip(
+            (packages, init_hooks, pre_init_hooks), _OPTIONAL_SECTIONS, strict=True
+        ):
+            for marker in markers:
+                assert (marker in result) is enabled, marker
 
     def test_order_of_sections(self):
         """Test that sections appear in correct order with multi-stage build."""
@@ -316,3 +318,46 @@ class TestMultiStageBuild:
         assert "FROM init AS pre-hooks" in result
         # runner should come from pre-hooks (not packages)
         assert "FROM pre-hooks AS runner" in result
+
+
+class TestBuildImage:
+    """Tests for the build command build_image hands to the manager."""
+
+    @pytest.fixture
+    def run(self, monkeypatch):
+        """Replace subprocess.run with a mock that reports success."""
+        mock_run = MagicMock(return_value=MagicMock(returncode=0))
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        return mock_run
+
+    @pytest.fixture
+    def manager(self):
+        """Mock container manager with a podman command prefix."""
+        mock_manager = MagicMock()
+        mock_manager.cmd_prefix = ["podman"]
+        return mock_manager
+
+    def test_command_without_cache_from(self, run, manager):
+        """Test the build reads the Containerfile from stdin."""
+        assert build_image(manager, "img:tag", "FROM alpine\n")
+
+        cmd = run.call_args.args[0]
+        assert cmd == ["podman", "build", "-t", "img:tag", "-f", "-", "."]
+        assert "--cache-from" not in cmd
+
+    def test_cache_from_precedes_containerfile(self, run, manager):
+        """Test --cache-from is passed before the stdin Containerfile and context."""
+        build_image(manager, "img:tag", "FROM alpine\n", cache_from="cache:latest")
+
+        cmd = run.call_args.args[0]
+        assert cmd == [
+            "podman",
+            "build",
+            "-t",
+            "img:tag",
+            "--cache-from",
+            "cache:latest",
+            "-f",
+            "-",
+            ".",
+        ]
@@ -0,0 +1,26 @@
+"""Unit tests for distrobox_plus.commands.enter module."""
+
+from __future__ import annotations
+
+import pytest
+
+from distrobox_plus.commands.enter import _split_args
+
+
+class TestSplitArgs:
+    """Tests for _split_args function."""
+
+    @pytest.mark.parametrize(
+        ("argv", "distrobox_args", "cmd"),
+        [
+            (["-n", "box", "--", "echo", "hi"], ["-n", "box"], ["echo", "hi"]),
+            (["-n", "box", "-e", "bash"], ["-n", "box"], ["bash"]),
+            (["-e", "sh", "--", "-e", "x"], ["-e", "sh"], ["-e", "x"]),
+            (["-n", "box", "--root"], ["-n", "box", "--root"], []),
+            ([], [], []),
+        ],
+        ids=["double-dash", "e-flag", "double-dash-wins", "no-delimiter", "empty"],
+    )
+    def test_split_args(self, argv, distrobox_args, cmd):
+        """Test splitting at --, falling back to the first -e."""
+        assert _split_args(argv) == (distrobox_args, cmd)
@@ -0,0 +1,110 @@
+"""Unit tests for distrobox_plus.commands.rm module."""
+
+from __future__ import annotations
+
+import pytest
+
+from distrobox_plus.commands.rm import (
+    cleanup_exported_apps,
+    cleanup_exported_binaries,
+)
+
+
+def _exported_binary(container_name: str) -> str:
+    """Return the header distrobox-export writes into exported binaries."""
+    return f"#!/bin/sh\n# distrobox_binary\n# name: {container_name}\n"
+
+
+def _desktop_entry(container_name: str, app: str) -> str:
+    """Return a desktop entry as exported from a container."""
+    return (
+        "[Desktop Entry]\n"
+        f"Name={app}\n"
+        f"Exec=/usr/bin/distrobox-enter -n {container_name} -- {app} %U\n"
+        f"Icon=/home/user/.local/share/icons/{app}.png\n"
+    )
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point the home directory at a temporary path."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+class TestCleanupExportedBinaries:
+    """Tests for cleanup_exported_binaries function."""
+
+    def test_removes_only_matching_binaries(self, home):
+        """Test that only binaries exported from the container are removed."""
+        bin_dir = home / ".local" / "bin"
+        bin_dir.mkdir(parents=True)
+        (bin_dir / "mine").write_text(_exported_binary("mybox"))
+        (bin_dir / "other").write_text(_exported_binary("otherbox"))
+        (bin_dir / "plain").write_text("#!/bin/sh\necho hello\n")
+
+        cleanup_exported_binaries("mybox")
+
+        assert sorted(p.name for p in bin_dir.iterdir()) == ["other", "plain"]
+
+    def test_skips_directories(self, home):
+        """Test that directories in the bin dir are left alone."""
+        bin_dir = home / ".local" / "bin"
+        (bin_dir / "subdir").mkdir(parents=True)
+
+        cleanup_exported_binaries("mybox")
+
+        assert (bin_dir / "subdir").is_dir()
+
+    def test_missing_bin_dir(self, monkeypatch, capsys):
+        """Test that a missing bin dir is skipped silently."""
+        # Nothing is written, so a home that does not exist is enough
+        monkeypatch.setenv("HOME", "/nonexistent/home")
+
+        cleanup_exported_binaries("mybox")
+
+        assert capsys.readouterr().out == ""
+
+
+class TestCleanupExportedApps:
+    """Tests for cleanup_exported_apps function."""
+
+    def test_removes_entries_and_icons(self, home):
+        """Test that entries and icons of the container's apps are removed."""
+        apps_dir = home / ".local" / "share" / "applications"
+        icon_dir = home / ".local" / "share" / "icons" / "hicolor" / "48x48" / "apps"
+        apps_dir.mkdir(parents=True)
+        icon_dir.mkdir(parents=True)
+        (apps_dir / "mybox-firefox.desktop").write_text(
+            _desktop_entry("mybox", "firefox")
+        )
+        (apps_dir / "mybox-vim.desktop").write_text(_desktop_entry("mybox", "vim"))
+        (icon_dir / "firefox.png").write_text("")
+        (icon_dir / "vim.svg").write_text("")
+        (icon_dir / "gimp.png").write_text("")
+
+        cleanup_exported_apps("mybox")
+
+        assert list(apps_dir.iterdir()) == []
+        assert [p.name for p in icon_dir.iterdir()] == ["gimp.png"]
+
+    def test_keeps_other_containers_apps(self, home):
+        """Test that entries exported from other containers are kept."""
+        apps_dir = home / ".local" / "share" / "applications"
+        apps_dir.mkdir(parents=True)
+        entry = apps_dir / "mybox2-firefox.desktop"
+        entry.write_text(_desktop_entry("mybox2", "firefox"))
+
+        cleanup_exported_apps("mybox")
+
+        assert entry.exists()
+
+    def test_missing_icons_dir(self, home):
+        """Test that a missing icons dir is not an error."""
+        apps_dir = home / ".local" / "share" / "applications"
+        apps_dir.mkdir(parents=True)
+        (apps_dir / "mybox-vim.desktop").write_text(_desktop_entry("mybox", "vim"))
+
+        cleanup_exported_apps("mybox")
+
+        assert list(apps_dir.iterdir()) == []
@@ -0,0 +1,49 @@
+"""Unit tests for distrobox_plus.commands.stop module."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from distrobox_plus.commands import stop
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Replace container manager detection with a mock manager."""
+    monkeypatch.delenv("SUDO_USER", raising=False)
+    monkeypatch.delenv("DOAS_USER", raising=False)
+    mock_manager = MagicMock()
+    mock_manager.run_interactive.return_value = 0
+    monkeypatch.setattr(stop, "detect_container_manager", lambda **_: mock_manager)
+    return mock_manager
+
+
+class TestStopRun:
+    """Tests for how run hands stops to the container manager."""
+
+    def test_single_container_execs(self, manager):
+        """Test that stopping one named container replaces the process."""
+        stop.run(["--yes", "mybox"])
+
+        manager.exec_replace.assert_called_once_with("stop", "mybox")
+
+    def test_multiple_containers_run(self, manager):
+        """Test that several containers are stopped one by one without exec."""
+        assert stop.run(["--yes", "box1", "box2"]) == 0
+
+        manager.exec_replace.assert_not_called()
+        assert manager.run_interactive.call_args_list == [
+            (("stop", "box1"),),
+            (("stop", "box2"),),
+        ]
+
+    def test_all_with_one_container_runs(self, manager, monkeypatch):
+        """Test that --all never execs, even when it finds a single container."""
+        monkeypatch.setattr(stop, "get_all_distrobox_names", lambda _: ["mybox"])
+
+        assert stop.run(["--yes", "--all"]) == 0
+
+        manager.exec_replace.assert_not_called()
+        manager.run_interactive.assert_called_once_with("stop", "mybox")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from distrobox_plus.utils.templates import (
     DISTROBOX_PACKAGES,
     generate_additional_packages_cmd,
@@ -12,6 +14,12 @@ from distrobox_plus.utils.templates import (
 )
 
 
+@pytest.fixture(scope="module")
+def package_sets():
+    """DISTROBOX_PACKAGES as frozensets, built once for membership checks."""
+    return {manager: frozenset(pkgs) for manager, pkgs in DISTROBOX_PACKAGES.items()}
+
+
 class TestDistroboxPackages:
     """Tests for DISTROBOX_PACKAGES constant."""
 
@@ -20,22 +28,17 @@ class TestDistroboxPackages:
         expected = {"apk", "apt", "dnf", "pacman", "zypper", "emerge", "xbps"}
         assert set(DISTROBOX_PACKAGES.keys()) == expected
 
-    def test_all_have_bash(self):
-        """Test that all package managers include bash."""
-        for manager, packages in DISTROBOX_PACKAGES.items():
+    @pytest.mark.parametrize("package", ["bash", "sudo", "curl"])
+    def test_all_have_package(self, package_sets, package):
+        """Test that all package managers include a core dependency."""
+        for manager, packages in package_sets.items():
             # emerge uses full package names
             if manager == "emerge":
-                assert any("bash" in pkg for pkg in packages), f"{manager} missing bash"
-            else:
-                assert "bash" in packages, f"{manager} missing bash"
-
-    def test_all_have_sudo(self):
-        """Test that all package managers include sudo."""
-        for manager, packages in DISTROBOX_PACKAGES.items():
-            if manager == "emerge":
-                assert any("sudo" in pkg for pkg in packages), f"{manager} missing sudo"
+                assert any(package in pkg for pkg in packages), (
+                    f"{manager} missing {package}"
+                )
             else:
-                assert "sudo" in packages, f"{manager} missing sudo"
+                assert package in packages, f"{manager} missing {package}"
 
     def test_packages_are_lists(self):
         """Test that all values are lists of strings."""